@@ -2,10 +2,14 @@
 Admin account initialization service
 """
 
+import logging
+
 from netwiz_backend.auth.jwt_utils import get_password_hash
-from netwiz_backend.auth.models import User, UserType
+from netwiz_backend.auth.models import ADMIN_USERNAME, User, UserType
 from netwiz_backend.auth.repository import AuthRepository
-from netwiz_backend.config import settings
+from netwiz_backend.config import get_settings
+
+logger = logging.getLogger(__name__)
 
 
 async def ensure_admin_account_exists(auth_repo: AuthRepository) -> None:
@@ -15,23 +19,28 @@ async def ensure_admin_account_exists(auth_repo: AuthRepository) -> None:
     This function checks if an admin user exists, and if not, creates one
     with the configured temporary password.
     """
+    settings = get_settings()
+
     # Check if admin user already exists
-    admin_user = await auth_repo.get_user_by_username("admin")
+    admin_user = await auth_repo.get_user_by_username(ADMIN_USERNAME)
 
     if admin_user is None:
         # Create admin user
-        admin_password_hash = get_password_hash(settings.admin_temp_password)
+        admin_password_hash = await get_password_hash(settings.admin_temp_password)
 
         admin_user = User(
-            username="admin",
+            username=ADMIN_USERNAME,
             hashed_password=admin_password_hash,
             user_type=UserType.ADMIN,
         )
 
         await auth_repo.create_user(admin_user)
-        print(
-            f"✅ Admin account created with temporary password: {settings.admin_temp_password}"
+        logger.warning(
+            "Admin account created with temporary password: %s",
+            settings.admin_temp_password,
+        )
+        logger.warning(
+            "IMPORTANT: Change the admin password immediately after first login!"
         )
-        print("⚠️  IMPORTANT: Change the admin password immediately after first login!")
     else:
-        print("✅ Admin account already exists")
+        logger.info("Admin account already exists")
@@ -2,23 +2,27 @@
 Authentication controller for NetWiz backend
 """
 
-from typing import ClassVar
+import logging
+from functools import cached_property
+from typing import Any, ClassVar, NamedTuple
 
 from fastapi import APIRouter, Depends, HTTPException, status
 from motor.core import AgnosticDatabase
 
-from netwiz_backend.auth.decorators import AUTH, PUBLIC
+from netwiz_backend.auth.decorators import AUTH, PUBLIC, requires_auth
 from netwiz_backend.auth.jwt_utils import (
     create_access_token,
     create_refresh_token,
     get_password_hash,
     get_refresh_token_expiration_time,
     get_token_expiration_time,
+    password_needs_rehash,
     verify_password,
     verify_refresh_token,
 )
-from netwiz_backend.auth.middleware_auth import get_current_active_user
+from netwiz_backend.auth.middleware import get_current_active_user
 from netwiz_backend.auth.models import (
+    ADMIN_USERNAME,
     AuthEndpoints,
     ChangePasswordRequest,
     RefreshTokenRequest,
@@ -31,10 +35,46 @@ from netwiz_backend.auth.models import (
     UserResponse,
     UserType,
 )
-from netwiz_backend.auth.repository import get_auth_repository
+from netwiz_backend.auth.repository import DuplicateUserError, get_auth_repository
 from netwiz_backend.controller_abc import RouteControllerABC
 from netwiz_backend.database import get_database
 
+logger = logging.getLogger(__name__)
+
+# Hoisted enum members for the hot permission checks below
+_ADMIN = UserType.ADMIN
+_USER = UserType.USER
+
+# Shared by every authenticated route instead of one list literal per route
+_AUTH_DEPENDENCIES = [Depends(get_current_active_user)]
+
+# Token lifetimes derive from settings, so compute the response fields once
+_ACCESS_EXPIRES_IN = get_token_expiration_time()
+_REFRESH_EXPIRES_IN = get_refresh_token_expiration_time()
+
+
+def _mint_tokens(user: User) -> Token:
+    """Issue a fresh access/refresh token pair for a user"""
+    token_data = {"sub": user.username, "user_id": user.id}
+    # Every field is produced by us, so skip Pydantic validation
+    return Token.model_construct(
+        access_token=create_access_token(data=token_data),
+        refresh_token=create_refresh_token(data=token_data),
+        token_type="bearer",
+        expires_in=_ACCESS_EXPIRES_IN,
+        refresh_expires_in=_REFRESH_EXPIRES_IN,
+    )
+
+
+class RouteSpec(NamedTuple):
+    """Declarative description of a single controller route"""
+
+    path: str
+    handler: str
+    methods: tuple[str, ...]
+    response_model: Any
+    status_code: int | None = None
+
 
 class AuthController(RouteControllerABC):
     """
@@ -44,70 +84,46 @@ class AuthController(RouteControllerABC):
 
     tags: ClassVar[list[str]] = ["auth"]
 
+    # (path, handler name, methods, response model, status code); whether a
+    # route gets the auth dependency is driven by the handler's @AUTH/@PUBLIC tag
+    _ROUTES: ClassVar[tuple[RouteSpec, ...]] = (
+        RouteSpec(
+            "/signup", "signup", ("POST",), UserResponse, status.HTTP_201_CREATED
+        ),
+        RouteSpec("/signin", "signin", ("POST",), Token),
+        RouteSpec("/signout", "signout", ("POST",), dict),
+        RouteSpec("/refresh", "refresh_token", ("POST",), Token),
+        RouteSpec("/change-password", "change_password", ("POST",), dict),
+        RouteSpec("/me", "get_current_user", ("GET",), UserResponse),
+        RouteSpec("/user/{user_id}", "get_user_by_id", ("GET",), UserResponse),
+        RouteSpec(
+            "/check-username",
+            "check_username_availability",
+            ("POST",),
+            UsernameCheckResponse,
+        ),
+    )
+
     def _register_routes(self, router: APIRouter):
         # Register authentication routes
-        router.add_api_route(
-            "/signup",
-            self.signup,
-            methods=["POST"],
-            response_model=UserResponse,
-            status_code=status.HTTP_201_CREATED,
-        )
-
-        router.add_api_route(
-            "/signin",
-            self.signin,
-            methods=["POST"],
-            response_model=Token,
-        )
-
-        router.add_api_route(
-            "/signout",
-            self.signout,
-            methods=["POST"],
-            response_model=dict,
-            dependencies=[Depends(get_current_active_user)],
-        )
-
-        router.add_api_route(
-            "/refresh",
-            self.refresh_token,
-            methods=["POST"],
-            response_model=Token,
-        )
-
-        router.add_api_route(
-            "/change-password",
-            self.change_password,
-            methods=["POST"],
-            response_model=dict,
-            dependencies=[Depends(get_current_active_user)],
-        )
-
-        router.add_api_route(
-            "/me",
-            self.get_current_user,
-            methods=["GET"],
-            response_model=UserResponse,
-            dependencies=[Depends(get_current_active_user)],
-        )
-        router.add_api_route(
-            "/user/{user_id}",
-            self.get_user_by_id,
-            methods=["GET"],
-            response_model=UserResponse,
-            dependencies=[Depends(get_current_active_user)],
-        )
-
-        router.add_api_route(
-            "/check-username",
-            self.check_username_availability,
-            methods=["POST"],
-            response_model=UsernameCheckResponse,
-        )
+        for spec in self._ROUTES:
+            handler = getattr(self, spec.handler)
+            router.add_api_route(
+                spec.path,
+                handler,
+                methods=list(spec.methods),
+                response_model=spec.response_model,
+                status_code=spec.status_code,
+                dependencies=_AUTH_DEPENDENCIES if requires_auth(handler) else None,
+            )
 
     def get_endpoints(self) -> AuthEndpoints:
-        """Generate auth endpoints based on the configured prefix."""
+        """Return auth endpoints based on the configured prefix."""
+        return self._endpoints
+
+    @cached_property
+    def _endpoints(self) -> AuthEndpoints:
+        """Auth endpoints, built once since the prefix never changes."""
         return AuthEndpoints(
             signup=f"{self.prefix}/signup",
             signin=f"{self.prefix}/signin",
@@ -132,20 +148,12 @@ class AuthController(RouteControllerABC):
         """
         auth_repo = get_auth_repository(database)
 
-        # Check if user already exists
-        if await auth_repo.user_exists(user_create.username):
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Username already registered",
-            )
-
         # Create new user
-        hashed_password = get_password_hash(user_create.password)
+        hashed_password = await get_password_hash(user_create.password)
 
-        # Set user type: admin if username is "admin", otherwise user
-        user_type = (
-            UserType.ADMIN if user_create.username.lower() == "admin" else UserType.USER
-        )
+        # Set user type: admin if username is "admin", otherwise user.
+        # UserCreate's validator already guarantees a lowercase username.
+        user_type = _ADMIN if user_create.username == ADMIN_USERNAME else _USER
 
         user = User(
             username=user_create.username,
@@ -153,7 +161,14 @@ class AuthController(RouteControllerABC):
             user_type=user_type,
         )
 
-        await auth_repo.create_user(user)
+        # The unique index on username rejects duplicates atomically
+        try:
+            await auth_repo.create_user(user)
+        except DuplicateUserError as e:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Username already registered",
+            ) from e
 
         return UserResponse(
             id=user.id,
@@ -179,9 +194,9 @@ class AuthController(RouteControllerABC):
 
         # Get user by username
         user = await auth_repo.get_user_by_username(user_login.username)
-        print(user_login.model_dump(), user.model_dump())
+        logger.debug("signin attempt user=%s", user_login.username)
         if not user:
-            print("user not found => incorrect username or password")
+            logger.debug("signin failed user=%s: user not found", user_login.username)
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Incorrect username or password",
@@ -189,8 +204,8 @@ class AuthController(RouteControllerABC):
             )
 
         # Verify password
-        if not verify_password(user_login.password, user.hashed_password):
-            print("incorrect password => incorrect username or password")
+        if not await verify_password(user_login.password, user.hashed_password):
+            logger.debug("signin failed user=%s: wrong password", user.username)
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Incorrect username or password",
@@ -199,23 +214,18 @@ class AuthController(RouteControllerABC):
 
         # Check if user is active
         if not user.is_active:
-            print("user not active")
+            logger.debug("signin failed user=%s: inactive", user.username)
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST, detail="Inactive user"
             )
 
+        # Transparently migrate legacy bcrypt / outdated Argon2 hashes
+        if password_needs_rehash(user.hashed_password):
+            new_hash = await get_password_hash(user_login.password)
+            await auth_repo.update_user(user.id, {"hashed_password": new_hash})
+
         # Create access and refresh tokens
-        token_data = {"sub": user.username, "user_id": user.id}
-        access_token = create_access_token(data=token_data)
-        refresh_token = create_refresh_token(data=token_data)
-
-        return Token(
-            access_token=access_token,
-            refresh_token=refresh_token,
-            token_type="bearer",
-            expires_in=get_token_expiration_time(),
-            refresh_expires_in=get_refresh_token_expiration_time(),
-        )
+        return _mint_tokens(user)
 
     @AUTH
     async def signout(
@@ -262,17 +272,7 @@ class AuthController(RouteControllerABC):
             )
 
         # Create new access and refresh tokens
-        token_data_dict = {"sub": user.username, "user_id": user.id}
-        access_token = create_access_token(data=token_data_dict)
-        refresh_token = create_refresh_token(data=token_data_dict)
-
-        return Token(
-            access_token=access_token,
-            refresh_token=refresh_token,
-            token_type="bearer",
-            expires_in=get_token_expiration_time(),
-            refresh_expires_in=get_refresh_token_expiration_time(),
-        )
+        return _mint_tokens(user)
 
     @AUTH
     async def change_password(
@@ -286,9 +286,12 @@ class AuthController(RouteControllerABC):
 
         Validates the current password and updates it with the new password.
         """
-        # Verify current password
-        if not verify_password(
-            change_request.current_password, current_user.hashed_password
+        # Verify current password against the stored hash, not the request
+        # user, which may come from the short-lived user cache
+        auth_repo = get_auth_repository(database)
+        user = await auth_repo.get_user_by_username(current_user.username)
+        if user is None or not await verify_password(
+            change_request.current_password, user.hashed_password
         ):
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
@@ -296,10 +299,9 @@ class AuthController(RouteControllerABC):
             )
 
         # Hash new password
-        new_password_hash = get_password_hash(change_request.new_password)
+        new_password_hash = await get_password_hash(change_request.new_password)
 
         # Update password in database
-        auth_repo = get_auth_repository(database)
         success = await auth_repo.update_user(
             current_user.id, {"hashed_password": new_password_hash}
         )
@@ -344,7 +346,7 @@ class AuthController(RouteControllerABC):
         Regular users can only access their own information.
         """
         # Check if user is trying to access their own info or is admin
-        if current_user.id != user_id and current_user.user_type != UserType.ADMIN:
+        if current_user.id != user_id and current_user.user_type != _ADMIN:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="Not authorized to access this user's information",
@@ -2,112 +2,175 @@
 JWT utilities for authentication
 """
 
-from datetime import datetime, timedelta, timezone
+import asyncio
+import hashlib
+import time
+from datetime import timedelta
 
 import bcrypt
 import jwt
+from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHashError, VerificationError
+from cachetools import TTLCache
 
 from netwiz_backend.auth.models import TokenData
-from netwiz_backend.config import settings
-
-
-def verify_password(plain_password: str, hashed_password: str) -> bool:
-    """Verify a password against its hash"""
+from netwiz_backend.config import get_settings
+
+_settings = get_settings()
+
+# Verified-token caches keyed by SHA-256 of the raw token. Values are
+# (TokenData, exp) so an entry never outlives the token it was decoded from.
+# TTLs are kept far below token lifetimes to bound the revocation window.
+_access_cache: TTLCache[bytes, tuple[TokenData, float]] = TTLCache(
+    maxsize=10_000, ttl=30
+)
+_refresh_cache: TTLCache[bytes, tuple[TokenData, float]] = TTLCache(
+    maxsize=10_000, ttl=60
+)
+
+# Argon2id with OWASP-recommended parameters. bcrypt is only kept to verify
+# hashes created before the switch; those are re-hashed on next sign-in.
+_password_hasher = PasswordHasher(time_cost=3, memory_cost=65536, parallelism=4)
+_BCRYPT_PREFIXES = ("$2a$", "$2b$", "$2y$")
+
+# Claims every token we issue carries; enforced by jwt.decode itself
+_REQUIRED_CLAIMS = ["exp", "type", "sub", "user_id"]
+
+# Signing keys pre-encoded once so PyJWT's prepare_key skips the str->bytes
+# conversion on every encode/decode
+_ACCESS_KEY = _settings.jwt_secret_key.encode("utf-8")
+_REFRESH_KEY = _settings.jwt_refresh_secret_key.encode("utf-8")
+_ALGORITHM = _settings.jwt_algorithm
+_ALGORITHMS = [_ALGORITHM]
+
+# Token lifetimes in whole seconds; exp claims are plain int timestamps
+_ACCESS_TTL_SECONDS = _settings.jwt_access_token_expire_minutes * 60
+_REFRESH_TTL_SECONDS = _settings.jwt_refresh_token_expire_days * 24 * 60 * 60
+
+
+def _verify_password_sync(plain_password: str, hashed_password: str) -> bool:
+    """Verify a password against its hash (blocking; see verify_password)"""
     # Add pepper to the plain password before verification
-    peppered_password = settings.password_pepper + plain_password
+    peppered_password = get_settings().password_pepper + plain_password
 
-    # Use bcrypt verification
-    return bcrypt.checkpw(
-        peppered_password.encode("utf-8"), hashed_password.encode("utf-8")
-    )
+    # Legacy bcrypt hashes are still accepted until they get re-hashed
+    if hashed_password.startswith(_BCRYPT_PREFIXES):
+        return bcrypt.checkpw(
+            peppered_password.encode("utf-8"), hashed_password.encode("utf-8")
+        )
 
+    try:
+        return _password_hasher.verify(hashed_password, peppered_password)
+    except (VerificationError, InvalidHashError):
+        return False
 
-def get_password_hash(password: str) -> str:
-    """Hash a password using bcrypt with application-specific pepper"""
+
+def _get_password_hash_sync(password: str) -> str:
+    """Hash a password using Argon2id with application-specific pepper (blocking)"""
     # Add the configured pepper to the password before hashing
     # This provides defense-in-depth: even with database access,
     # attackers need both the hash AND this secret pepper
-    peppered_password = settings.password_pepper + password
+    peppered_password = get_settings().password_pepper + password
+
+    # Argon2 generates a random salt and encodes it alongside the parameters
+    return _password_hasher.hash(peppered_password)
 
-    # Use bcrypt to hash the peppered password with a random salt
-    salt = bcrypt.gensalt()
-    hashed = bcrypt.hashpw(peppered_password.encode("utf-8"), salt)
-    return hashed.decode("utf-8")
+
+async def verify_password(plain_password: str, hashed_password: str) -> bool:
+    """Verify a password against its hash without blocking the event loop"""
+    # Hashing is deliberately slow and releases the GIL, so run it in a worker
+    # thread and let other requests proceed concurrently
+    return await asyncio.to_thread(
+        _verify_password_sync, plain_password, hashed_password
+    )
+
+
+async def get_password_hash(password: str) -> str:
+    """Hash a password with application-specific pepper in a worker thread"""
+    return await asyncio.to_thread(_get_password_hash_sync, password)
+
+
+def password_needs_rehash(hashed_password: str) -> bool:
+    """Check whether a stored hash is legacy bcrypt or uses outdated parameters"""
+    if hashed_password.startswith(_BCRYPT_PREFIXES):
+        return True
+    try:
+        return _password_hasher.check_needs_rehash(hashed_password)
+    except InvalidHashError:
+        return True
 
 
 def create_access_token(data: dict, expires_delta: timedelta | None = None) -> str:
     """Create a JWT access token"""
     to_encode = data.copy()
-    if expires_delta:
-        expire = datetime.now(timezone.utc) + expires_delta
-    else:
-        expire = datetime.now(timezone.utc) + timedelta(
-            minutes=settings.jwt_access_token_expire_minutes
-        )
-    to_encode.update({"exp": expire, "type": "access"})
-    encoded_jwt = jwt.encode(
-        to_encode, settings.jwt_secret_key, algorithm=settings.jwt_algorithm
-    )
+    ttl = int(expires_delta.total_seconds()) if expires_delta else _ACCESS_TTL_SECONDS
+    to_encode.update({"exp": int(time.time()) + ttl, "type": "access"})
+    encoded_jwt = jwt.encode(to_encode, _ACCESS_KEY, algorithm=_ALGORITHM)
     return encoded_jwt
 
 
 def create_refresh_token(data: dict, expires_delta: timedelta | None = None) -> str:
     """Create a JWT refresh token"""
     to_encode = data.copy()
-    if expires_delta:
-        expire = datetime.now(timezone.utc) + expires_delta
-    else:
-        expire = datetime.now(timezone.utc) + timedelta(
-            days=settings.jwt_refresh_token_expire_days
-        )
-    to_encode.update({"exp": expire, "type": "refresh"})
-    encoded_jwt = jwt.encode(
-        to_encode, settings.jwt_refresh_secret_key, algorithm=settings.jwt_algorithm
-    )
+    ttl = int(expires_delta.total_seconds()) if expires_delta else _REFRESH_TTL_SECONDS
+    to_encode.update({"exp": int(time.time()) + ttl, "type": "refresh"})
+    encoded_jwt = jwt.encode(to_encode, _REFRESH_KEY, algorithm=_ALGORITHM)
     return encoded_jwt
 
 
-def verify_token(token: str) -> TokenData | None:
-    """Verify and decode a JWT access token"""
+def _verify_cached(
+    token: str,
+    secret_key: bytes,
+    expected_type: str,
+    cache: TTLCache[bytes, tuple[TokenData, float]],
+) -> TokenData | None:
+    """Decode a JWT, reusing a previous successful verification if cached"""
+    cache_key = hashlib.sha256(token.encode("utf-8")).digest()
+    cached = cache.get(cache_key)
+    if cached is not None:
+        token_data, exp = cached
+        if exp > time.time():
+            return token_data
+        cache.pop(cache_key, None)
+
     try:
+        # PyJWT rejects tokens that are expired or missing any required claim
         payload = jwt.decode(
-            token, settings.jwt_secret_key, algorithms=[settings.jwt_algorithm]
+            token,
+            secret_key,
+            algorithms=_ALGORITHMS,
+            options={"require": _REQUIRED_CLAIMS},
         )
-        token_type = payload.get("type")
-        if token_type != "access":
-            return None
-        username: str = payload.get("sub")
-        user_id: str = payload.get("user_id")
-        if username is None or user_id is None:
-            return None
-        return TokenData(username=username, user_id=user_id)
     except jwt.PyJWTError:
         return None
 
+    if payload["type"] != expected_type:
+        return None
+
+    # The payload is trusted once the signature checks out, so skip validation
+    token_data = TokenData.model_construct(
+        username=payload["sub"], user_id=payload["user_id"]
+    )
+    # Failures are never cached; only tokens that passed full verification
+    cache[cache_key] = (token_data, float(payload["exp"]))
+    return token_data
+
+
+def verify_token(token: str) -> TokenData | None:
+    """Verify and decode a JWT access token"""
+    return _verify_cached(token, _ACCESS_KEY, "access", _access_cache)
+
 
 def verify_refresh_token(token: str) -> TokenData | None:
     """Verify and decode a JWT refresh token"""
-    try:
-        payload = jwt.decode(
-            token, settings.jwt_refresh_secret_key, algorithms=[settings.jwt_algorithm]
-        )
-        token_type = payload.get("type")
-        if token_type != "refresh":
-            return None
-        username: str = payload.get("sub")
-        user_id: str = payload.get("user_id")
-        if username is None or user_id is None:
-            return None
-        return TokenData(username=username, user_id=user_id)
-    except jwt.PyJWTError:
-        return None
+    return _verify_cached(token, _REFRESH_KEY, "refresh", _refresh_cache)
 
 
 def get_token_expiration_time() -> int:
     """Get access token expiration time in seconds"""
-    return settings.jwt_access_token_expire_minutes * 60
+    return _ACCESS_TTL_SECONDS
 
 
 def get_refresh_token_expiration_time() -> int:
     """Get refresh token expiration time in seconds"""
-    return settings.jwt_refresh_token_expire_days * 24 * 60 * 60
+    return _REFRESH_TTL_SECONDS
@@ -3,20 +3,64 @@ Authentication middleware and dependencies
 """
 
 
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from motor.core import AgnosticDatabase
 
 from netwiz_backend.auth.jwt_utils import verify_token
-from netwiz_backend.auth.models import User
+from netwiz_backend.auth.models import TokenData, User
 from netwiz_backend.auth.repository import get_auth_repository
 from netwiz_backend.database import get_database
 
 # HTTP Bearer token scheme
 security = HTTPBearer(auto_error=False)
 
+# Marks request.state entries that have not been resolved yet (None is a result)
+_UNSET = object()
+
+
+def bearer_token_from_header(authorization: str | None) -> str | None:
+    """Extract the token from an ``Authorization: Bearer <token>`` header value"""
+    if not authorization:
+        return None
+    scheme, _, token = authorization.partition(" ")
+    if scheme.lower() != "bearer" or not token:
+        return None
+    return token
+
+
+def get_request_token_data(
+    request: Request, credentials: HTTPAuthorizationCredentials | None
+) -> TokenData | None:
+    """
+    Get the verified token data for this request
+
+    Reuses the result stored on ``request.state`` by ``auth_middleware`` so the
+    JWT is decoded at most once per request.
+    """
+    token_data = getattr(request.state, "token_data", _UNSET)
+    if token_data is _UNSET:
+        token_data = verify_token(credentials.credentials) if credentials else None
+        request.state.token_data = token_data
+    return token_data
+
+
+async def get_request_user(
+    request: Request, token_data: TokenData, database: AgnosticDatabase
+) -> User | None:
+    """Get the user for this request's token, looking it up at most once"""
+    user = getattr(request.state, "current_user", None)
+    if user is None:
+        auth_repo = get_auth_repository(database)
+        user = await auth_repo.get_user_by_username(
+            token_data.username, use_cache=True
+        )
+        request.state.current_user = user
+    return user
+
 
 async def get_current_user(
+    request: Request,
     credentials: HTTPAuthorizationCredentials | None = Depends(security),
     database: AgnosticDatabase = Depends(get_database),
 ) -> User:
@@ -32,15 +76,11 @@ async def get_current_user(
         headers={"WWW-Authenticate": "Bearer"},
     )
 
-    if credentials is None:
-        raise credentials_exception
-
-    token_data = verify_token(credentials.credentials)
+    token_data = get_request_token_data(request, credentials)
     if token_data is None:
         raise credentials_exception
 
-    auth_repo = get_auth_repository(database)
-    user = await auth_repo.get_user_by_username(token_data.username)
+    user = await get_request_user(request, token_data, database)
     if user is None:
         raise credentials_exception
 
@@ -63,6 +103,7 @@ async def get_current_active_user(
 
 
 async def get_optional_current_user(
+    request: Request,
     credentials: HTTPAuthorizationCredentials | None = Depends(security),
     database: AgnosticDatabase = Depends(get_database),
 ) -> User | None:
@@ -71,16 +112,8 @@ async def get_optional_current_user(
 
     This dependency is useful for endpoints that work with or without authentication.
     """
-    if credentials is None:
+    token_data = get_request_token_data(request, credentials)
+    if token_data is None:
         return None
 
-    try:
-        token_data = verify_token(credentials.credentials)
-        if token_data is None:
-            return None
-
-        auth_repo = get_auth_repository(database)
-        user = await auth_repo.get_user_by_username(token_data.username)
-        return user
-    except HTTPException:
-        return None
+    return await get_request_user(request, token_data, database)
@@ -2,29 +2,51 @@
 Authentication middleware that enforces decorator-based access control
 """
 
+import logging
 from collections.abc import Callable
 
-from fastapi import HTTPException, Request, status
-from fastapi.responses import JSONResponse
+from fastapi import Request, status
+from fastapi.responses import ORJSONResponse
+from starlette.routing import Match
 
 from netwiz_backend.auth.decorators import (
     get_auth_level,
     is_admin_required,
     requires_auth,
 )
-from netwiz_backend.auth.middleware import (
-    get_current_active_user,
-    get_optional_current_user,
-)
+from netwiz_backend.auth.jwt_utils import verify_token
+from netwiz_backend.auth.middleware import bearer_token_from_header, get_request_user
 from netwiz_backend.auth.models import UserType
+from netwiz_backend.database import get_database
+
+logger = logging.getLogger(__name__)
+
+_ADMIN = UserType.ADMIN
+
+
+def _matching_endpoint(request: Request) -> Callable | None:
+    """
+    Find the endpoint the router will dispatch this request to.
+
+    HTTP middleware runs before routing, so ``request.scope["route"]`` is not
+    set yet; the app's routes are matched here the same way the router does.
+    """
+    for route in request.app.router.routes:
+        match, _ = route.matches(request.scope)
+        if match is Match.FULL:
+            return getattr(route, "endpoint", None)
+    return None
 
 
 async def auth_middleware(request: Request, call_next: Callable):
     """
     Middleware that enforces authentication based on decorator attributes.
 
-    This middleware checks if the endpoint has authentication decorators
-    and enforces the appropriate access control.
+    The bearer token is only decoded for routes that require authentication,
+    and the result is stored on ``request.state`` so the ``get_current_user``
+    family of dependencies can reuse it instead of verifying the JWT (and
+    loading the user) a second time. Other routes leave decoding to their own
+    dependencies, if any.
     """
     # Skip auth middleware for FastAPI internal routes
     internal_routes = {
@@ -38,43 +60,50 @@ async def auth_middleware(request: Request, call_next: Callable):
     if request.url.path in internal_routes:
         return await call_next(request)
 
-    # Get the route handler
-    route = request.scope.get("route")
-    if not route or not hasattr(route, "endpoint"):
+    handler = _matching_endpoint(request)
+    if handler is None:
         return await call_next(request)
 
-    handler = route.endpoint
-
-    # Check if authentication is required
-    if not requires_auth(handler):
+    # Check if authentication is required; optional auth is left to the
+    # handler's own dependency
+    if not requires_auth(handler) or get_auth_level(handler) == "optional":
         return await call_next(request)
 
-    # Get authentication level
-    auth_level = get_auth_level(handler)
-
-    try:
-        if auth_level == "optional":
-            # Optional auth - get user if available
-            current_user = await get_optional_current_user()
-        else:
-            # Required auth - get authenticated user
-            current_user = await get_current_active_user()
-            print(
-                f"DEBUG: Got user {current_user.username}, is_active: {current_user.is_active}, user_type: {current_user.user_type}"
+    token = bearer_token_from_header(request.headers.get("authorization"))
+    token_data = verify_token(token) if token else None
+    request.state.token_data = token_data
+    if token_data is None:
+        return ORJSONResponse(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            content={"detail": "Could not validate credentials"},
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+    # Check admin requirement
+    if is_admin_required(handler):
+        database = await get_database()
+        current_user = await get_request_user(request, token_data, database)
+        if current_user is None:
+            return ORJSONResponse(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                content={"detail": "Could not validate credentials"},
+                headers={"WWW-Authenticate": "Bearer"},
+            )
+        logger.debug(
+            "auth user=%s is_active=%s user_type=%s",
+            current_user.username,
+            current_user.is_active,
+            current_user.user_type,
+        )
+        if current_user.user_type != _ADMIN:
+            logger.debug(
+                "admin required, user=%s has user_type=%s",
+                current_user.username,
+                current_user.user_type,
+            )
+            return ORJSONResponse(
+                status_code=status.HTTP_403_FORBIDDEN,
+                content={"detail": "Admin privileges required"},
             )
-
-            # Check admin requirement
-            if is_admin_required(handler) and current_user.user_type != UserType.ADMIN:
-                print("user not admin", current_user.user_type)
-                return JSONResponse(
-                    status_code=status.HTTP_403_FORBIDDEN,
-                    content={"detail": "Admin privileges required"},
-                )
-
-        # Add user to request state for use in handlers
-        request.state.current_user = current_user
-
-    except HTTPException as e:
-        return JSONResponse(status_code=e.status_code, content={"detail": e.detail})
 
     return await call_next(request)
@@ -6,6 +6,7 @@ import re
 import uuid
 from datetime import datetime, timezone
 from enum import Enum
+from typing import Any
 
 from pydantic import BaseModel, Field, constr, validator
 
@@ -49,6 +50,10 @@ def validate_username_format(username: str) -> str:
     return username
 
 
+# Reserved username that is always given the admin user type
+ADMIN_USERNAME = "admin"
+
+
 class UserType(str, Enum):
     """User type enumeration"""
 
@@ -83,10 +88,47 @@ class User(BaseModel):
 
     def __init__(self, **data):
         super().__init__(**data)
-        # Auto-set admin type if username is "admin" (case insensitive)
-        if self.username.lower() == "admin":
+        # Auto-set admin type if username is "admin" (the username validator
+        # rejects anything that is not lowercase, so no case folding needed)
+        if self.username == ADMIN_USERNAME:
             self.user_type = UserType.ADMIN
 
+    @property
+    def is_admin(self) -> bool:
+        """Whether this user has the admin user type"""
+        # identity check on the enum member, no string comparison
+        return self.user_type is UserType.ADMIN
+
+    def to_mongo_doc(self) -> dict[str, Any]:
+        """
+        Build the MongoDB document for this user.
+
+        Equivalent to model_dump() for this flat model, but avoids walking the
+        model through Pydantic's serializer. Keep in sync with the fields above.
+        """
+        return {
+            "id": self.id,
+            "username": self.username,
+            "hashed_password": self.hashed_password,
+            "user_type": self.user_type.value,
+            "created_at": self.created_at,
+            "is_active": self.is_active,
+        }
+
+    @classmethod
+    def from_mongo_doc(cls, doc: dict[str, Any]) -> "User":
+        """
+        Rehydrate a user from a MongoDB document without re-validating it.
+
+        Documents are only ever written from validated User instances, so the
+        validators are skipped; only the enum needs converting back. Unknown
+        keys such as Mongo's ``_id`` are dropped.
+        """
+        fields = {name: doc[name] for name in cls.model_fields if name in doc}
+        if "user_type" in fields:
+            fields["user_type"] = UserType(fields["user_type"])
+        return cls.model_construct(**fields)
+
 
 class UserCreate(BaseModel):
     """Model for user creation request"""
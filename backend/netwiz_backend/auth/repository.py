@@ -2,59 +2,140 @@
 Authentication repository for user operations using dependency injection
 """
 
+from cachetools import TTLCache
 from motor.core import AgnosticDatabase
+from pymongo.errors import DuplicateKeyError
 
 from netwiz_backend.auth.models import User
 
+# Short-lived in-process cache of users by username, used only for resolving
+# the user of an authenticated request (get_user_by_username(use_cache=True)),
+# which saves a Mongo round-trip per request. Writes through this repository
+# invalidate it, but only in this process: other workers may keep serving a
+# changed or deactivated user until the TTL expires, so the TTL is kept short
+# and credential checks never read from it.
+_user_cache: TTLCache[str, User] = TTLCache(maxsize=5000, ttl=5)
+
+# User ID -> username of the entry cached above, so invalidating by ID is a
+# lookup instead of a scan
+_cached_usernames: TTLCache[str, str] = TTLCache(maxsize=5000, ttl=5)
+
+# Username -> exists, for availability checks. The short TTL bounds how long
+# an answer can be stale; inserts and deletes here keep it accurate locally.
+_exists_cache: TTLCache[str, bool] = TTLCache(maxsize=50_000, ttl=10)
+
+
+def _invalidate_user_id(user_id: str) -> None:
+    """Drop the cached user entry belonging to the given user ID"""
+    username = _cached_usernames.pop(user_id, None)
+    if username is not None:
+        _user_cache.pop(username, None)
+
+
+class DuplicateUserError(Exception):
+    """Raised when inserting a user whose username or ID is already taken"""
+
 
 class AuthRepository:
     """Repository for authentication operations with dependency injection"""
 
     def __init__(self, database: AgnosticDatabase):
+        self.database = database
         self.collection = database.users
 
+    async def ensure_indexes(self) -> None:
+        """Create the unique indexes used by username and ID lookups"""
+        await self.collection.create_index("username", unique=True)
+        await self.collection.create_index("id", unique=True)
+
     async def create_user(self, user: User) -> str:
-        """Create a new user"""
-        doc = user.model_dump()
-        result = await self.collection.insert_one(doc)
+        """Create a new user
+
+        Raises:
+            DuplicateUserError: If the username (or ID) is already registered
+        """
+        doc = user.to_mongo_doc()
+        try:
+            result = await self.collection.insert_one(doc)
+        except DuplicateKeyError as e:
+            raise DuplicateUserError(user.username) from e
+        _exists_cache[user.username] = True
         return str(result.inserted_id)
 
     async def get_user_by_id(self, user_id: str) -> User | None:
         """Get user by ID"""
         doc = await self.collection.find_one({"id": user_id})
         if doc is not None:
-            doc = User(**doc)
+            doc = User.from_mongo_doc(doc)
         return doc
 
-    async def get_user_by_username(self, username: str) -> User | None:
-        """Get user by username"""
+    async def get_user_by_username(
+        self, username: str, use_cache: bool = False
+    ) -> User | None:
+        """Get user by username
+
+        Args:
+            username: The username to look up
+            use_cache: Allow an answer up to a few seconds old. Only for
+                resolving request users, never for checking credentials.
+        """
+        if use_cache:
+            user = _user_cache.get(username)
+            if user is not None:
+                # callers get their own copy; the cached instance never leaks
+                return user.model_copy()
         doc = await self.collection.find_one({"username": username})
-        if doc is not None:
-            doc = User(**doc)
-        return doc
+        if doc is None:
+            return None
+        user = User.from_mongo_doc(doc)
+        _user_cache[username] = user
+        _cached_usernames[user.id] = username
+        return user.model_copy()
 
     async def update_user(self, user_id: str, update_data: dict) -> bool:
         """Update user data"""
         result = await self.collection.update_one(
             {"id": user_id}, {"$set": update_data}
         )
+        _invalidate_user_id(user_id)
         return result.modified_count > 0
 
     async def delete_user(self, user_id: str) -> bool:
         """Delete user by ID"""
         result = await self.collection.delete_one({"id": user_id})
+        _invalidate_user_id(user_id)
+        # The deleted username is unknown here; deletes are rare, so reset all
+        _exists_cache.clear()
         return result.deleted_count > 0
 
     async def user_exists(self, username: str) -> bool:
         """Check if user exists by username"""
-        doc = await self.collection.find_one({"username": username})
-        return doc is not None
+        exists = _exists_cache.get(username)
+        if exists is None:
+            if username in _user_cache:
+                exists = True
+            else:
+                doc = await self.collection.find_one(
+                    {"username": username}, projection={"_id": 1}
+                )
+                exists = doc is not None
+            _exists_cache[username] = exists
+        return exists
 
     async def count_users(self) -> int:
         """Count total users"""
         return await self.collection.count_documents({})
 
 
+# Repositories are stateless per request, so keep one per database object.
+# Keyed by id() because Motor database objects are not reliably hashable.
+_repo_cache: dict[int, AuthRepository] = {}
+
+
 def get_auth_repository(database: AgnosticDatabase) -> AuthRepository:
-    """Factory function to create auth repository with database dependency"""
-    return AuthRepository(database)
+    """Factory function returning the auth repository for a database"""
+    repo = _repo_cache.get(id(database))
+    # The identity check guards against id() reuse after a reconnect
+    if repo is None or repo.database is not database:
+        repo = _repo_cache[id(database)] = AuthRepository(database)
+    return repo
@@ -3,9 +3,10 @@ Configuration management using environment variables
 """
 
 import os
+from functools import cached_property, lru_cache
 
 from dotenv import load_dotenv
-from pydantic import Field, field_validator
+from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 from netwiz_backend import (
@@ -19,10 +20,6 @@ from netwiz_backend import (
     __url__,
 )
 
-# Load environment variables from .env file
-load_dotenv()
-
-
 class Settings(BaseSettings):
     """Application settings loaded from environment variables and __init__.py"""
 
@@ -60,12 +57,10 @@ class Settings(BaseSettings):
     # CORS Configuration
     cors_origins: str = Field(default="*", alias="CORS_ORIGINS")
 
-    @field_validator("cors_origins", mode="after")
-    @classmethod
-    def parse_cors_origins(cls, v):
-        if isinstance(v, str):
-            return [origin.strip() for origin in v.split(",")]
-        return v
+    @cached_property
+    def cors_origin_list(self) -> list[str]:
+        """CORS origins split out of the comma-separated setting, parsed on first use"""
+        return [origin.strip() for origin in self.cors_origins.split(",")]
 
     # Logging Configuration
     log_level: str = Field(default="INFO", alias="LOG_LEVEL")
@@ -103,5 +98,21 @@ class Settings(BaseSettings):
     )
 
 
-# Create global settings instance
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Get the application settings, loading them on first use.
+
+    The .env file is parsed and every field resolved exactly once; later calls
+    return the same instance.
+    """
+    # Load environment variables from .env file
+    load_dotenv()
+    return Settings()
+
+
+def __getattr__(name: str):
+    # Backwards compatibility for ``from netwiz_backend.config import settings``
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -13,7 +13,8 @@ class RouteControllerABC(ABC):
 
     def __init__(self, prefix: str = "/netlist"):
         self.prefix = prefix
-        self.router = APIRouter(prefix=self.prefix, tags=self.tags)
+        # tags is a class-level declaration on each concrete controller
+        self.router = APIRouter(prefix=prefix, tags=type(self).tags)
         self._register_routes(self.router)
 
     def register(self, app):
@@ -2,24 +2,37 @@
 MongoDB database service for NetWiz using dependency injection
 """
 
-from collections.abc import AsyncGenerator
+import asyncio
+import logging
 
 from motor.core import AgnosticClient, AgnosticDatabase
 from motor.motor_asyncio import AsyncIOMotorClient
 
-from .config import settings
+from .config import get_settings
+
+logger = logging.getLogger(__name__)
 
 
 class DatabaseManager:
-    """MongoDB connection manager with context manager support"""
+    """MongoDB connection manager with async context manager support"""
 
     def __init__(self):
         self._client: AgnosticClient | None = None
         self._database: AgnosticDatabase | None = None
+        # Serializes first connection attempts; _ready is set once the ping succeeds
+        self._lock = asyncio.Lock()
+        self._ready = asyncio.Event()
 
     async def connect(self) -> None:
         """Initialize database connection"""
-        if self._client is None:
+        if self._ready.is_set():
+            return
+        # Concurrent first requests wait here instead of each building a
+        # client and pinging the server
+        async with self._lock:
+            if self._ready.is_set():
+                return
+            settings = get_settings()
             try:
                 self._client = AsyncIOMotorClient(
                     settings.mongodb_uri,
@@ -31,9 +44,10 @@ class DatabaseManager:
 
                 # Actually test the connection by pinging the server
                 await self._client.admin.command("ping")
-                print(f"✅ Connected to MongoDB: {settings.mongodb_database}")
+                self._ready.set()
+                logger.info("Connected to MongoDB: %s", settings.mongodb_database)
             except Exception as e:
-                print(f"❌ Failed to connect to MongoDB: {e}")
+                logger.error("Failed to connect to MongoDB: %s", e)
                 # Clean up failed connection
                 if self._client:
                     self._client.close()
@@ -44,10 +58,11 @@ class DatabaseManager:
     async def disconnect(self) -> None:
         """Close database connection"""
         if self._client:
+            self._ready.clear()
             self._client.close()
             self._client = None
             self._database = None
-            print("✅ MongoDB connection closed")
+            logger.info("MongoDB connection closed")
 
     @property
     def database(self) -> AgnosticDatabase:
@@ -74,16 +89,6 @@ class DatabaseManager:
         # during the application lifetime. Only disconnect on app shutdown.
         pass
 
-    def __enter__(self) -> "DatabaseManager":
-        """Sync context manager entry (for compatibility)"""
-        # Note: This won't work with async operations, but provides compatibility
-        raise RuntimeError("Use 'async with' for async database operations")
-
-    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
-        """Sync context manager exit (for compatibility)"""
-        # Note: This won't work with async operations, but provides compatibility
-        raise RuntimeError("Use 'async with' for async database operations")
-
     async def temporary_connection(self) -> "TemporaryConnection":
         """
         Create a temporary connection that will be closed on exit
@@ -116,22 +121,18 @@ class TemporaryConnection:
 _db_manager = DatabaseManager()
 
 
-async def get_database() -> AsyncGenerator[AgnosticDatabase, None]:
+async def get_database() -> AgnosticDatabase:
     """
     FastAPI dependency to get database instance
 
-    This is the recommended pattern for FastAPI:
-    - Simple and clean
-    - Proper lifecycle management
-    - Easy to test and mock
+    A plain coroutine rather than a generator dependency: there is no
+    per-request teardown (the connection lives for the app lifetime), so
+    FastAPI can skip the exit-stack bookkeeping, and once the manager is
+    ready this is just a flag check and an attribute read.
     """
-    await _db_manager.connect()
-    try:
-        yield _db_manager.database
-    finally:
-        # Note: We don't disconnect here as the connection should persist
-        # during the application lifetime. Disconnect happens on app shutdown.
-        pass
+    if not _db_manager._ready.is_set():
+        await _db_manager.connect()
+    return _db_manager.database
 
 
 async def init_database() -> None:
@@ -2,11 +2,14 @@
 Git metadata utilities for loading build-time git information
 """
 
-import json
 import os
 import subprocess
+from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 
+import orjson
+
 from netwiz_backend.system.models import GitMetadata
 
 
@@ -34,43 +37,97 @@ def _run_git_command(command: list[str], cwd: Path) -> str | None:
         return None
 
 
+# Sentinel distinguishing "not searched yet" from "no repository found"
+_UNSET = object()
+_git_root: Path | None | object = _UNSET
+
+
+def _find_git_root() -> Path | None:
+    """
+    Find the git repository root containing this package.
+
+    Walks up from this file's directory looking for a ``.git`` entry, once per
+    process; later calls return the remembered result.
+
+    Returns:
+        Repository root directory, or None if not inside a git checkout
+    """
+    global _git_root
+
+    if _git_root is _UNSET:
+        _git_root = None
+        path = os.path.dirname(os.path.abspath(__file__))
+        while True:
+            try:
+                os.stat(os.path.join(path, ".git"))
+            except OSError:
+                parent = os.path.dirname(path)
+                if parent == path:
+                    break
+                path = parent
+            else:
+                _git_root = Path(path)
+                break
+
+    return _git_root
+
+
+@lru_cache(maxsize=1)
 def _detect_git_metadata() -> GitMetadata | None:
     """
     Detect git metadata by running git commands in the current directory.
 
+    The result is computed on first call and reused for the process lifetime,
+    so git normally runs exactly once.
+
     Returns:
         GitMetadata object if git information is available, None otherwise
     """
     try:
-        # Find the git repository root
-        current_dir = Path(__file__).parent
-        git_root = None
-
-        # Walk up the directory tree to find .git directory
-        for path in [current_dir, *list(current_dir.parents)]:
-            if (path / ".git").exists():
-                git_root = path
-                break
-
+        git_root = _find_git_root()
         if not git_root:
             return None
 
-        # Get git information
-        commit_hash = _run_git_command(["git", "rev-parse", "HEAD"], git_root)
-        if not commit_hash:
+        # Get hash, short hash and ref names (e.g. "HEAD -> main, tag: v1.0")
+        # from a single git process instead of one per field
+        output = _run_git_command(
+            [
+                "git",
+                "-c",
+                "core.quotepath=off",
+                "log",
+                "-1",
+                "--decorate=short",
+                "--format=%H%x00%h%x00%D",
+                "HEAD",
+            ],
+            git_root,
+        )
+        if not output:
             return None
 
-        commit_short = _run_git_command(
-            ["git", "rev-parse", "--short", "HEAD"], git_root
-        )
-        branch = _run_git_command(
-            ["git", "rev-parse", "--abbrev-ref", "HEAD"], git_root
-        )
-        tag = _run_git_command(["git", "describe", "--tags", "--exact-match"], git_root)
+        parts = output.split("\x00")
+        if len(parts) != 3:
+            return None
+        commit_hash, commit_short, refnames = parts
+
+        branch = None
+        tag = None
+        for ref in refnames.split(", "):
+            if ref.startswith("HEAD -> "):
+                branch = ref[len("HEAD -> ") :]
+            elif ref == "HEAD":
+                # Detached HEAD; matches `git rev-parse --abbrev-ref HEAD`
+                branch = "HEAD"
+            elif ref.startswith("tag: ") and tag is None:
+                tag = ref[len("tag: ") :]
+
+        if branch is None:
+            branch = _run_git_command(
+                ["git", "rev-parse", "--abbrev-ref", "HEAD"], git_root
+            )
 
         # Get build time (current time)
-        from datetime import datetime, timezone
-
         build_time = datetime.now(timezone.utc).isoformat()
 
         return GitMetadata(
@@ -88,51 +145,59 @@ def _detect_git_metadata() -> GitMetadata | None:
         return None
 
 
+# Build-time metadata file, plus (st_mtime_ns, parsed result) of the last read
+_METADATA_FILE = Path(__file__).parent / "git_metadata.json"
+_git_meta_cache: tuple[int, GitMetadata | None] | None = None
+
+
 def load_git_metadata() -> GitMetadata | None:
     """
     Load git metadata from the build-time generated file.
 
+    The file is only re-parsed when its modification time changes; otherwise
+    the result of the previous read is returned after a single stat call.
+
     Returns:
         GitMetadata object if file exists and is valid, None otherwise
     """
+    global _git_meta_cache
+
     try:
-        # Try to find the git metadata file
-        current_dir = Path(__file__).parent
-        metadata_file = current_dir / "git_metadata.json"
+        mtime = os.stat(_METADATA_FILE).st_mtime_ns
+    except OSError:
+        return None
 
-        if not metadata_file.exists():
-            return None
+    cached = _git_meta_cache
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
 
-        with open(metadata_file) as f:
-            data = json.load(f)
+    metadata = None
+    try:
+        data = orjson.loads(_METADATA_FILE.read_bytes())
 
         # Only return metadata if we have at least some meaningful data
-        if any(data.get(key) for key in ["commit_hash", "commit_short", "branch"]):
-            return GitMetadata(**data)
-
-    except (json.JSONDecodeError, FileNotFoundError, Exception):
-        # Silently fail if we can't load the metadata
-        pass
+        if any(data.get(key) for key in ("commit_hash", "commit_short", "branch")):
+            metadata = GitMetadata(**data)
+    except (OSError, ValueError, TypeError, AttributeError):
+        # Unreadable, malformed or mis-shaped file (ValidationError is a
+        # ValueError); treat as absent until the file changes
+        metadata = None
 
-    return None
+    _git_meta_cache = (mtime, metadata)
+    return metadata
 
 
-def get_git_metadata() -> GitMetadata | None:
+@lru_cache(maxsize=1)
+def _fallback_git_metadata() -> GitMetadata | None:
     """
-    Get git metadata with multiple fallback strategies:
-    1. Load from build-time generated file (production builds)
-    2. Load from environment variables (CI/CD or manual setup)
-    3. Detect from git repository (development from source)
+    Resolve git metadata from environment variables or the git repository.
+
+    Neither source changes while the server runs, so this is computed once.
 
     Returns:
         GitMetadata object if available, None otherwise
     """
-    # First try to load from file (production builds)
-    metadata = load_git_metadata()
-    if metadata:
-        return metadata
-
-    # Fallback to environment variables (CI/CD or manual setup)
+    # Environment variables (CI/CD or manual setup)
     commit_hash = os.environ.get("GIT_COMMIT_HASH")
     commit_short = os.environ.get("GIT_COMMIT_SHORT")
     branch = os.environ.get("GIT_BRANCH")
@@ -148,5 +213,26 @@ def get_git_metadata() -> GitMetadata | None:
             build_sha=os.environ.get("BUILD_SHA"),
         )
 
-    # Final fallback: detect from git repository (development from source)
+    # Detect from git repository (development from source)
     return _detect_git_metadata()
+
+
+def get_git_metadata() -> GitMetadata | None:
+    """
+    Get git metadata with multiple fallback strategies:
+    1. Load from build-time generated file (production builds)
+    2. Load from environment variables (CI/CD or manual setup)
+    3. Detect from git repository (development from source)
+
+    The file is revalidated by mtime on each call; the environment/git
+    fallback is resolved once per process.
+
+    Returns:
+        GitMetadata object if available, None otherwise
+    """
+    # First try to load from file (production builds)
+    metadata = load_git_metadata()
+    if metadata:
+        return metadata
+
+    return _fallback_git_metadata()
@@ -1,24 +1,33 @@
+import hashlib
 import json
+import sys
+from collections import OrderedDict
+from dataclasses import replace
 from typing import Any
 
 from json_source_map import calculate  # pip install json-source-map
 
 from netwiz_backend.json_tracker.errors import TrackedJSONDecodeError
 from netwiz_backend.json_tracker.helpers import (
-    _ancestors_of,
+    _KIND_BY_TYPE,
+    _escape_pointer_token,
     _infer_kind,
-    _last_segment,
-    _line_length_at,
-    _resolve_pointer,
+    _loads_json,
 )
 from netwiz_backend.json_tracker.self_test import self_test_locations
 from netwiz_backend.json_tracker.types import LocationInfo
 
+# SHA-256 digests of texts whose self-test found no problems, oldest first.
+# Digests rather than hash(), which collides too easily to skip a check on;
+# rather than the texts themselves, which would keep every document alive.
+_SELF_TESTED_MAX = 512
+_self_tested: OrderedDict[bytes, None] = OrderedDict()
+
 # ── Public API ──────────────────────────────────────────────────────────────────
 
 
 def create_location_mapping(
-    json_text: str, raise_on_error: bool = False, self_test: bool = True
+    json_text: str, raise_on_error: bool = False, self_test: bool = False
 ) -> dict[str, LocationInfo]:
     """
     Build a mapping of dot-path -> LocationInfo for every JSON value and object key.
@@ -50,119 +59,168 @@ def create_location_mapping(
         core source mapping functionality. We extend it with parent relationships
         and additional metadata for our specific use case.
     """
+    return _build_location_mapping(json_text, raise_on_error, self_test)[0]
+
+
+def _build_location_mapping(
+    json_text: str, raise_on_error: bool, self_test: bool
+) -> tuple[dict[str, LocationInfo], Any]:
+    """
+    Build the location mapping and also return the parsed value.
+
+    The source map needs the parsed document anyway, so callers that want the
+    value too (TrackedJson) take it from here instead of parsing again.
+
+    Args:
+        json_text: The JSON string to analyze
+        raise_on_error: If True, raise TrackedJSONDecodeError on parse errors
+        self_test: If True, run internal validation checks on the location mapping
+
+    Returns:
+        The mapping as create_location_mapping returns it, and the parsed
+        value (None for the synthetic error mapping)
+
+    Raises:
+        TrackedJSONDecodeError: If raise_on_error=True and JSON is invalid
+    """
     # Try to parse; if it fails, emit a synthetic error LocationInfo and return early.
     try:
-        data: Any = json.loads(json_text)
+        # both parsers raise json.JSONDecodeError (msg/pos/lineno/colno)
+        data: Any = _loads_json(json_text)
     except json.JSONDecodeError as e:
-        err_path = "$.__error__"
-        # Convert Python's 0-based absolute pos and 1-based line/col into our 1-based fields.
-        abs_start = e.pos + 1
-        # We create a 1-char span at the error site; callers can expand if desired.
-        abs_end = min(len(json_text), e.pos + 1) + 1 if len(json_text) > 0 else 1
-
-        error_loc = LocationInfo(
-            parents=[
-                LocationInfo(
-                    parents=[],
-                    key="$",
-                    kind="object",
-                    start_character_number=1,
-                    start_line_number=1,
-                    start_line_character_number=1,
-                    end_character_number=max(1, len(json_text)),
-                    end_line_number=e.lineno,  # best-effort: end at error line
-                    end_line_character_number=e.colno,
-                )
-            ],
-            key="__error__",
-            kind="string",
-            start_character_number=abs_start,
-            start_line_number=e.lineno,
-            start_line_character_number=e.colno,
-            end_character_number=abs_end,
-            end_line_number=e.lineno,
-            end_line_character_number=min(
-                e.colno + 1, max(1, _line_length_at(json_text, e.lineno))
+        # The error node itself is built by the error type; we only attach
+        # the root "$" it hangs off so it has the same shape as other nodes.
+        err = TrackedJSONDecodeError.from_stdlib_error(e, json_text)
+        error_loc = err.error_loc = replace(
+            err.error_loc,
+            parent=LocationInfo(
+                key="$",
+                kind="object",
+                start_character_number=1,
+                start_line_number=1,
+                start_line_character_number=1,
+                end_character_number=max(1, len(json_text)),
+                end_line_number=e.lineno,  # best-effort: end at error line
+                end_line_character_number=e.colno,
             ),
+            level=1,
         )
         if raise_on_error:
-            raise TrackedJSONDecodeError(error_loc, json_text) from e
-        return {err_path: error_loc}
+            raise err from e
+        return {"$.__error__": error_loc}, None
 
     # Build source map once
     entries = calculate(json_text)
 
     # We’ll create LocationInfo instances for every pointer (value) and its key.
-    # To populate `parents`, we need a second pass to link to parents by path.
     path_to_loc: dict[str, LocationInfo] = {}
-    pointer_mapping: dict[str, str] = {}
-
-    # Helper to convert RFC6901 pointer to our dot-path
-    def pointer_to_path(ptr: str) -> str:
-        if not ptr:
-            return "$"
-        parts = ptr.lstrip("/").split("/")
-        out: list[str] = []
-        for p in parts:
-            key = p.replace("~1", "/").replace("~0", "~")
-            out.append(key if not out else f".{key}")
-        return "$." + "".join(out)
-
-    # First pass: create LocationInfo objects without parents (we’ll fill them later)
-    for pointer, entry in entries.items():
-        dot_path = pointer_to_path(pointer)
-        pointer_mapping[pointer] = dot_path
-
-        # Value entry
-        if entry.value_start and entry.value_end:
+
+    # Walk the parsed data once in document order instead of re-resolving every
+    # pointer from the root. Each pending node carries its pointer, dot-path,
+    # key, parent and depth, so parents always exist before their children and
+    # no ancestor lookups are needed: (value, pointer, dot_path, key, parent, level)
+    stack: list[tuple[Any, str, str, str, LocationInfo | None, int]] = [
+        (data, "", "$", "$", None, 0)
+    ]
+
+    # Bind globals and bound methods used per node to locals (LOAD_FAST)
+    new_loc = LocationInfo
+    kind_of = _KIND_BY_TYPE.get
+    infer_kind = _infer_kind
+    escape = _escape_pointer_token
+    intern = sys.intern
+    get_entry = entries.get
+    pop = stack.pop
+    push = stack.extend
+
+    while stack:
+        val, pointer, dot_path, key, parent, level = pop()
+        child_parent, child_level = parent, level
+        entry = get_entry(pointer)
+
+        if entry is not None:
+            # Value entry
             vs, ve = entry.value_start, entry.value_end
-            val = _resolve_pointer(data, pointer)  # ← add this line
-            path_to_loc[dot_path] = LocationInfo(
-                parents=[],  # fill later
-                key=_last_segment(dot_path),
-                kind=_infer_kind(val),
-                start_character_number=vs.position + 1,
-                start_line_number=vs.line + 1,
-                start_line_character_number=vs.column + 1,
-                end_character_number=ve.position + 1,
-                end_line_number=ve.line + 1,
-                end_line_character_number=ve.column + 1,
-            )
+            if vs is not None and ve is not None:
+                # positional, in field order: key, kind, start char/line/col,
+                # end char/line/col, parent, level
+                value_loc = new_loc(
+                    key,
+                    kind_of(type(val)) or infer_kind(val),
+                    vs.position + 1,
+                    vs.line + 1,
+                    vs.column + 1,
+                    ve.position + 1,
+                    ve.line + 1,
+                    ve.column + 1,
+                    parent,
+                    level,
+                )
+                path_to_loc[dot_path] = value_loc
+                # Value node is the structural parent of its key and children
+                child_parent, child_level = value_loc, level + 1
 
-        # Key entry (for object members)
-        if entry.key_start and entry.key_end:
+            # Key entry (object members only; array elements skip this entirely)
             ks, ke = entry.key_start, entry.key_end
-            key_path = dot_path  # same path; distinguish via kind="key"
-            path_to_loc[f"{key_path}.__key__"] = LocationInfo(
-                parents=[],  # fill later
-                key=_last_segment(dot_path),
-                kind="key",
-                start_character_number=ks.position + 1,
-                start_line_number=ks.line + 1,
-                start_line_character_number=ks.column + 1,
-                end_character_number=ke.position + 1,
-                end_line_number=ke.line + 1,
-                end_line_character_number=ke.column + 1,
-            )
+            if ks is not None and ke is not None:
+                path_to_loc[intern(f"{dot_path}.__key__")] = new_loc(
+                    key,
+                    "key",
+                    ks.position + 1,
+                    ks.line + 1,
+                    ks.column + 1,
+                    ke.position + 1,
+                    ke.line + 1,
+                    ke.column + 1,
+                    child_parent,
+                    child_level,
+                )
 
-    # Second pass: wire up parents (oldest → newest).
-    # For "$.a.b.0.c", parents are: ["$", "$.a", "$.a.b", "$.a.b.0"]
-    for path, loc in path_to_loc.items():
-        if path == "$":
-            continue
-        parents_chain = []
-        for ancestor in _ancestors_of(path):
-            anc_loc_value = path_to_loc.get(
-                ancestor
-            )  # prefer value node as structural parent
-            if anc_loc_value:
-                parents_chain.append(anc_loc_value)
-        loc.parents = parents_chain
+        # Queue children reversed so they pop off the stack in document order.
+        # Child dot-paths extend the parent's path (never re-decoded from the
+        # pointer) and are interned, since they are the keys every downstream
+        # lookup into the mapping hashes and compares; so are the member keys,
+        # which become the keys of the per-node children maps.
+        if isinstance(val, dict):
+            push(
+                (
+                    child,
+                    f"{pointer}/{escape(k)}",
+                    intern(f"{dot_path}.{k}"),
+                    intern(k),
+                    child_parent,
+                    child_level,
+                )
+                for k, child in reversed(val.items())
+            )
+        elif isinstance(val, list):
+            push(
+                (
+                    child,
+                    f"{pointer}/{i}",
+                    intern(f"{dot_path}.{i}"),
+                    intern(str(i)),
+                    child_parent,
+                    child_level,
+                )
+                for i, child in reversed(list(enumerate(val)))
+            )
 
     if self_test:
-        self_test_locations(json_text, path_to_loc)
-
-    return path_to_loc
+        fingerprint = hashlib.sha256(
+            json_text.encode("utf-8", "surrogatepass")
+        ).digest()
+        if fingerprint in _self_tested:
+            # already validated; the mapping is deterministic for a given text.
+            # Re-inserting marks it most recent (pop tolerates a concurrent
+            # eviction, since loads may run in worker threads)
+            _self_tested[fingerprint] = _self_tested.pop(fingerprint, None)
+        elif not self_test_locations(json_text, path_to_loc):
+            _self_tested[fingerprint] = None
+            if len(_self_tested) > _SELF_TESTED_MAX:
+                _self_tested.popitem(last=False)
+
+    return path_to_loc, data
 
 
 if __name__ == "__main__":
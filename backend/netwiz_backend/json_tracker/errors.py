@@ -86,7 +86,6 @@ class TrackedJSONDecodeError(json.JSONDecodeError):
             end_col = e.colno + 1
 
         loc = LocationInfo(
-            parents=[],  # leave empty; callers can fill if desired
             key="__error__",
             kind="string",  # not a real JSON value; placeholder is fine
             start_character_number=e.pos + 1,
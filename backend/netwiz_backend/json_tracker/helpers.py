@@ -1,7 +1,73 @@
+import json
+import re
+from itertools import accumulate
 from typing import Any
 
+import orjson
+
 from netwiz_backend.json_tracker.types import Kind, LocationInfo
 
+# RFC 6901 escape sequences, decoded in a single left-to-right scan
+_POINTER_ESCAPE = re.compile(r"~[01]")
+_UNESCAPE_MAP = {"~0": "~", "~1": "/"}
+
+# Characters str.splitlines treats as line boundaries ("\r\n" counts as one)
+_LINE_BREAKS = frozenset("\n\r\v\f\x1c\x1d\x1e\x85\u2028\u2029")
+
+# JSON parsers only produce these exact types, so a kind is one dict lookup.
+# bool is listed on its own: it subclasses int but is a distinct JSON kind.
+_KIND_BY_TYPE: dict[type, Kind] = {
+    dict: "object",
+    list: "list",
+    type(None): "null",
+    bool: "boolean",
+    int: "number",
+    float: "number",
+    str: "string",
+}
+
+
+# orjson only represents integers that fit in 64 bits; wider ones are turned
+# into floats or rejected, depending on its version. Any run of 19+ digits
+# might be one, so such texts are parsed by the stdlib, which keeps them exact.
+_LONG_DIGIT_RUN = re.compile(r"\d{19,}")
+
+
+class _NonJsonConstant(ValueError):
+    """Raised by the stdlib parser for NaN/Infinity, which orjson rejects too"""
+
+    def __init__(self, name: str):
+        super().__init__(f"{name} is not valid JSON")
+        self.name = name
+
+
+def _reject_constant(name: str) -> Any:
+    raise _NonJsonConstant(name)
+
+
+def _loads_json(text: str) -> Any:
+    """
+    Parse JSON text, with orjson unless it may hold an integer wider than 64 bits.
+
+    Args:
+        text: The JSON text
+
+    Returns:
+        The parsed value
+
+    Raises:
+        json.JSONDecodeError: If the text is not valid JSON (orjson's error
+            type subclasses it)
+    """
+    if _LONG_DIGIT_RUN.search(text) is None:
+        return orjson.loads(text)
+    try:
+        return json.loads(text, parse_constant=_reject_constant)
+    except _NonJsonConstant as e:
+        # best-effort position: the first occurrence of the literal
+        pos = max(text.find(e.name), 0)
+        raise json.JSONDecodeError(str(e), text, pos) from None
+
 
 def _unescape_pointer_token(token: str) -> str:
     """
@@ -11,13 +77,35 @@ def _unescape_pointer_token(token: str) -> str:
     - "~1" to "/"
     - "~0" to "~"
 
+    A single scan means "~01" correctly decodes to "~1" rather than "/".
+    Tokens without a "~" (the common case) are returned as-is.
+
     Args:
         token: Token to unescape
 
     Returns:
         Unescaped token
     """
-    return token.replace("~1", "/").replace("~0", "~")
+    if "~" not in token:
+        return token
+    return _POINTER_ESCAPE.sub(lambda m: _UNESCAPE_MAP[m.group(0)], token)
+
+
+def _escape_pointer_token(token: str) -> str:
+    """
+    Escape a key as a JSON Pointer token according to RFC 6901.
+
+    Converts:
+    - "~" to "~0"
+    - "/" to "~1"
+
+    Args:
+        token: Object key to escape
+
+    Returns:
+        Escaped token
+    """
+    return token.replace("~", "~0").replace("/", "~1")
 
 
 def _resolve_pointer(data: Any, pointer: str) -> Any:
@@ -38,9 +126,10 @@ def _resolve_pointer(data: Any, pointer: str) -> Any:
     if pointer == "" or pointer == "/":
         return data
     cur = data
-    for part in pointer.lstrip("/").split("/"):
+    # split("/")[0] is the empty string before the leading slash
+    for part in pointer.split("/")[1:]:
         key = _unescape_pointer_token(part)
-        cur = cur[int(key)] if isinstance(cur, list) else cur[key]
+        cur = cur[int(key)] if type(cur) is list else cur[key]
     return cur
 
 
@@ -54,6 +143,10 @@ def _infer_kind(val: Any) -> Kind:
     Returns:
         JSON kind string ("object", "list", "null", "string", "boolean", "number")
     """
+    kind = _KIND_BY_TYPE.get(type(val))
+    if kind is not None:
+        return kind
+    # subclasses (e.g. OrderedDict, IntEnum); bool must be tested before int
     if isinstance(val, dict):
         return "object"
     if isinstance(val, list):
@@ -64,7 +157,6 @@ def _infer_kind(val: Any) -> Kind:
         return "boolean"
     if isinstance(val, int | float):
         return "number"
-        return "number"
     return "string"
 
 
@@ -95,14 +187,13 @@ def _ancestors_of(dot_path: str) -> list[str]:
     Returns:
         List of ancestor paths from root to immediate parent
     """
-    # For "$.user.name" → ["$", "$.user"]
-    if dot_path == "$":
-        return []
-    parts = dot_path.split(".")  # ["$", "user", "name"]
-    # build cumulative prefixes, excluding self
+    # For "$.user.name" → ["$", "$.user"]; each ancestor is the prefix ending
+    # just before a dot, so one left-to-right scan finds them all
     ancestors = []
-    for i in range(1, len(parts)):
-        ancestors.append(".".join(parts[:i]))
+    i = dot_path.find(".")
+    while i != -1:
+        ancestors.append(dot_path[:i])
+        i = dot_path.find(".", i + 1)
     return ancestors
 
 
@@ -117,9 +208,52 @@ def _line_length_at(text: str, one_based_line: int) -> int:
     Returns:
         Length of the specified line
     """
-    lines = text.splitlines() or [""]
-    idx = max(1, min(one_based_line, len(lines))) - 1
-    return len(lines[idx]) if 0 <= idx < len(lines) else 1
+    starts = _line_starts(text)
+    idx = max(1, min(one_based_line, len(starts))) - 1
+    return _line_length(text, starts, idx)
+
+
+def _line_starts(text: str) -> list[int]:
+    """
+    Get the 0-based absolute offset at which each line of the text starts.
+
+    Line boundaries follow str.splitlines. Not cached: it is only needed once
+    per self-test or error location, and a cache keyed by the text would keep
+    every recent document alive.
+
+    Args:
+        text: The full text
+
+    Returns:
+        Start offset of each line (``[0]`` for empty text)
+    """
+    lines = text.splitlines(keepends=True)
+    if not lines:
+        # empty input edge case
+        return [0]
+    return list(accumulate(map(len, lines[:-1]), initial=0))
+
+
+def _line_length(text: str, starts: list[int], idx: int) -> int:
+    """
+    Measure one line from the line-start table, excluding its line terminator.
+
+    Args:
+        text: The full text
+        starts: Line start offsets from _line_starts(text)
+        idx: 0-based line index into starts
+
+    Returns:
+        Length of the line without its terminator
+    """
+    start = starts[idx]
+    end = starts[idx + 1] if idx + 1 < len(starts) else len(text)
+    if end > start and text[end - 1] in _LINE_BREAKS:
+        end -= 1
+        # "\r\n" is a single terminator
+        if end > start and text[end - 1] == "\r" and text[end] == "\n":
+            end -= 1
+    return end - start
 
 
 def _get_full_location(text: str) -> LocationInfo:
@@ -132,16 +266,15 @@ def _get_full_location(text: str) -> LocationInfo:
     Returns:
         LocationInfo spanning the entire text
     """
-    lines = text.splitlines() or [""]
-    last_line = lines[-1]
+    # One pass for the line table; the last line is measured in place
+    starts = _line_starts(text)
     return LocationInfo(
-        parents=[],
         key="$",
         kind="key",
         start_character_number=1,
         start_line_number=1,
         start_line_character_number=1,
         end_character_number=len(text),
-        end_line_number=len(lines),
-        end_line_character_number=len(last_line),
+        end_line_number=len(starts),
+        end_line_character_number=_line_length(text, starts, len(starts) - 1),
     )
@@ -1,13 +1,142 @@
+import copy
 import json
+import sys
+from collections import OrderedDict
 from collections.abc import Iterable, Iterator
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
-from netwiz_backend.json_tracker import create_location_mapping
+import orjson
+
+from netwiz_backend.json_tracker.create_location_mapping import (
+    _build_location_mapping,
+)
 from netwiz_backend.json_tracker.errors import TrackedJSONDecodeError
-from netwiz_backend.json_tracker.helpers import _get_full_location
+from netwiz_backend.json_tracker.helpers import (
+    _get_full_location,
+    _loads_json,
+    _unescape_pointer_token,
+)
 from netwiz_backend.json_tracker.types import LocationInfo
 
+# Marks a node whose value has not been parsed yet (None is a valid JSON value)
+_UNSET = object()
+
+# Leading characters of an absolute path: "$" (dot path) or "/" (JSON Pointer)
+_ABSOLUTE_PREFIXES = frozenset("$/")
+
+
+# Path strings recur constantly across lookups, so the parsing is memoized;
+# the caches are bounded so arbitrary user input cannot grow them forever.
+# Results are interned like the mapping's own keys, so the lookup that follows
+# usually matches by identity without comparing characters.
+@lru_cache(maxsize=4096)
+def _pointer_to_dot(ptr: str) -> str:
+    """
+    Convert a JSON Pointer (RFC 6901) to dot notation.
+
+    Examples:
+        ""            -> "$"
+        "/"           -> "$"
+        "/user/name"  -> "$.user.name"
+        "/items/0/id" -> "$.items.0.id"
+
+    Args:
+        ptr: JSON Pointer string
+
+    Returns:
+        Dot notation path
+    """
+    if not ptr or ptr == "/":
+        return "$"
+
+    parts = ptr.lstrip("/").split("/")
+    # unescape per RFC 6901: "~1" → "/", "~0" → "~"
+    decoded = [_unescape_pointer_token(p) for p in parts]
+    return sys.intern("$." + ".".join(decoded))
+
+
+# Location mappings of recently loaded valid texts, oldest first, keyed by
+# (json_text, self_test); the text itself is the key, so a hash collision can
+# never hand back another document's mapping
+_LOCATIONS_CACHE_MAX = 32
+_locations_cache: OrderedDict[tuple[str, bool], dict[str, LocationInfo]] = OrderedDict()
+
+
+def _shared_locations(
+    json_text: str, self_test: bool
+) -> tuple[dict[str, LocationInfo], Any]:
+    """
+    Build (or reuse) the location mapping for a valid JSON text.
+
+    Loading the same text again returns the very same mapping, so repeated
+    loads skip both the source-map pass and the self-test. Parse errors are
+    raised and therefore never cached. The mapping is shared between every
+    TrackedJson over this text; callers must not mutate it. The parsed value
+    is never cached, so each load owns its own data.
+
+    Args:
+        json_text: The JSON string to analyze
+        self_test: If True, run internal validation checks on the location mapping
+
+    Returns:
+        The mapping, and the parsed value when the mapping had to be built
+        (_UNSET when it was reused)
+
+    Raises:
+        TrackedJSONDecodeError: If the JSON is invalid
+    """
+    key = (json_text, self_test)
+    locations = _locations_cache.get(key)
+    if locations is not None:
+        # mark as most recent (pop's default tolerates a concurrent eviction)
+        _locations_cache[key] = _locations_cache.pop(key, locations)
+        return locations, _UNSET
+
+    locations, data = _build_location_mapping(
+        json_text, raise_on_error=True, self_test=self_test
+    )
+    _locations_cache[key] = locations
+    if len(_locations_cache) > _LOCATIONS_CACHE_MAX:
+        _locations_cache.popitem(last=False)
+    return locations, data
+
+
+@lru_cache(maxsize=4096)
+def _normalize_path(base: str, path: str) -> str:
+    """
+    Normalize a user-supplied path into internal dot-path format.
+
+    Supports multiple path formats:
+    - "$" (root)
+    - "user.name" (dot path)
+    - "/user/name" (JSON Pointer)
+    - "name" (relative to current context)
+
+    Args:
+        base: Dot path of the context the path is relative to
+        path: Path to normalize
+
+    Returns:
+        Normalized dot path
+    """
+    if not path:
+        return base
+
+    # JSON Pointer → dot path
+    if path.startswith("/"):
+        return _pointer_to_dot(path)
+
+    # already absolute
+    if path.startswith("$"):
+        return sys.intern(path)
+
+    # relative path (e.g. "name" inside "$.user")
+    if base == "$":
+        return sys.intern(f"$.{path}")
+    return sys.intern(f"{base}.{path}")
+
 
 class TrackedJson:
     """
@@ -48,9 +177,26 @@ class TrackedJson:
         We extend it with hierarchical navigation and enhanced error reporting.
     """
 
+    __slots__ = (
+        "json_text",
+        "locations",
+        "error",
+        "location",
+        "path",
+        "level",
+        "_root",
+        "_children",
+        "_child_locs",
+        "_value",
+    )
+
     @classmethod
     def load(
-        cls, f: str | Path, raise_on_error: bool = False, self_test: bool = True
+        cls,
+        f: str | Path,
+        raise_on_error: bool = False,
+        self_test: bool = False,
+        use_cache: bool = False,
     ) -> "TrackedJson":
         """
         Load TrackedJson from a file.
@@ -60,6 +206,9 @@ class TrackedJson:
             raise_on_error: If True, raise TrackedJSONDecodeError on parse errors.
                            If False, store error in .error attribute
             self_test: If True, run internal validation checks on the location mapping
+            use_cache: If True, reuse the location mapping of an identical,
+                      recently loaded text instead of rebuilding it. Only
+                      worth it for callers that load the same text repeatedly
 
         Returns:
             TrackedJson instance with the parsed JSON and location information
@@ -71,12 +220,19 @@ class TrackedJson:
         with Path(f).open() as f:
             json_text = f.read()
         return cls(
-            json_text=json_text, raise_on_error=raise_on_error, self_test=self_test
+            json_text=json_text,
+            raise_on_error=raise_on_error,
+            self_test=self_test,
+            use_cache=use_cache,
         )
 
     @classmethod
     def loads(
-        cls, json_text: str, raise_on_error: bool = False, self_test: bool = True
+        cls,
+        json_text: str,
+        raise_on_error: bool = False,
+        self_test: bool = False,
+        use_cache: bool = False,
     ) -> "TrackedJson":
         """
         Create TrackedJson from a JSON string.
@@ -86,6 +242,9 @@ class TrackedJson:
             raise_on_error: If True, raise TrackedJSONDecodeError on parse errors.
                            If False, store error in .error attribute
             self_test: If True, run internal validation checks on the location mapping
+            use_cache: If True, reuse the location mapping of an identical,
+                      recently loaded text instead of rebuilding it. Only
+                      worth it for callers that load the same text repeatedly
 
         Returns:
             TrackedJson instance with the parsed JSON and location information
@@ -94,7 +253,10 @@ class TrackedJson:
             TrackedJSONDecodeError: If raise_on_error=True and JSON is invalid
         """
         return cls(
-            json_text=json_text, raise_on_error=raise_on_error, self_test=self_test
+            json_text=json_text,
+            raise_on_error=raise_on_error,
+            self_test=self_test,
+            use_cache=use_cache,
         )
 
     def dumps(self):
@@ -109,7 +271,7 @@ class TrackedJson:
         """
         if self.error:
             raise self.error
-        return json.dumps(self.data)
+        return json.dumps(self._shared_value())
 
     def dump(self, f: str | Path) -> None:
         """
@@ -124,7 +286,7 @@ class TrackedJson:
         if self.error:
             raise self.error
         with Path(f).open(mode="w") as f:
-            json.dump(self.data, f)
+            json.dump(self._shared_value(), f)
 
     def to_json(self) -> str:
         """
@@ -147,7 +309,7 @@ class TrackedJson:
 
         # Build the location data structure
         location_data = {
-            "original_data": self.data,
+            "original_data": self._shared_value(),
             "original_text": self.json_text,
             "locations": {},
             "error": None,
@@ -182,10 +344,12 @@ class TrackedJson:
         self,
         json_text: str,
         raise_on_error: bool = False,
-        self_test: bool = True,
+        self_test: bool = False,
+        use_cache: bool = False,
         _locations: dict[str, LocationInfo] | None = None,
         _location: LocationInfo | None = None,
         _path: str | None = None,
+        _root: "TrackedJson | None" = None,
     ) -> None:
         """
         Initialize TrackedJson instance.
@@ -195,20 +359,42 @@ class TrackedJson:
             raise_on_error: If True, raise TrackedJSONDecodeError on parse errors.
                            If False, store error in .error attribute
             self_test: If True, run internal validation checks on the location mapping
+            use_cache: If True, reuse the location mapping of an identical,
+                      recently loaded text instead of rebuilding it. Only
+                      worth it for callers that load the same text repeatedly
             _locations: Internal parameter for creating sub-contexts
             _location: Internal parameter for creating sub-contexts
             _path: Internal parameter for creating sub-contexts
+            _root: Internal parameter pointing sub-contexts at the root context,
+                which owns the state shared across the document
         """
         self.json_text = json_text
-        self.locations: dict[str, LocationInfo] = _locations or create_location_mapping(
-            json_text, raise_on_error=raise_on_error, self_test=self_test
-        )
-
-        # fix: check the synthesized error node path actually used by the builder
-        if (
+        # a freshly built mapping comes with the parsed document, which then
+        # seeds the root's value instead of being parsed again on first access
+        value: Any = _UNSET
+        if _locations is None:
+            if use_cache:
+                try:
+                    _locations, value = _shared_locations(json_text, self_test)
+                except TrackedJSONDecodeError as err:
+                    if raise_on_error:
+                        raise
+                    # same single-entry shape create_location_mapping returns
+                    _locations = {"$.__error__": err.error_loc}
+            else:
+                _locations, value = _build_location_mapping(
+                    json_text, raise_on_error=raise_on_error, self_test=self_test
+                )
+        self.locations: dict[str, LocationInfo] = _locations
+
+        # The error state belongs to the document: sub-contexts inherit it and
+        # only the root checks for the builder's synthesized error node
+        if _root is not None:
+            self.error = _root.error
+        elif (
             not raise_on_error
             and len(self.locations) == 1
-            and list(self.locations.keys())[0] == "$.__error__"
+            and "$.__error__" in self.locations
         ):
             error_loc = self.locations["$.__error__"]
             self.error = TrackedJSONDecodeError(error_loc, json_text)
@@ -216,39 +402,92 @@ class TrackedJson:
             self.error = None
 
         # current node (default = root "$")
-        self.location: LocationInfo = _location or self.locations.get(
-            "$", _get_full_location(json_text)
-        )
+        # (the whole-text fallback is only built when there is no root entry)
+        location = _location or self.locations.get("$")
+        if location is None:
+            location = _get_full_location(json_text)
+        self.location: LocationInfo = location
         self.path: str = _path or "$"
-        self.level: int = getattr(self.location, "level", 0)
+        self.level: int = location.level
+
+        # document-wide state (children index, parsed value) lives on the root
+        self._root: TrackedJson = _root or self
+        self._children: dict[int, dict[str, tuple[LocationInfo, str]]] | None = None
+        # this node's own slice of that index, filled in on first child access
+        self._child_locs: dict[str, tuple[LocationInfo, str]] | None = None
+
+        # parsed value of this node, filled in on first _shared_value()
+        self._value: Any = value if _location is None else _UNSET
+
+    def _child(self, location: LocationInfo, path: str) -> "TrackedJson":
+        """
+        Create a sub-context for a location within this document.
+
+        Bypasses __init__: everything a sub-context needs (text, locations,
+        error state, root) is shared by reference from this context, so there
+        is nothing to recompute per lookup.
 
-        # precompute line starts…
-        self._lines = json_text.splitlines(keepends=True)
-        self._line_starts: list[int] = []
-        acc = 0
-        for ln in self._lines:
-            self._line_starts.append(acc)
-            acc += len(ln)
-        if not self._lines:
-            self._line_starts.append(0)
+        Args:
+            location: LocationInfo of the element
+            path: Absolute dot path of the element
 
-    def _direct_child_locs(self) -> dict[str, LocationInfo]:
+        Returns:
+            TrackedJson instance for the element
+        """
+        child = object.__new__(TrackedJson)
+        child.json_text = self.json_text
+        child.locations = self.locations
+        child.error = self.error
+        child.location = location
+        child.path = path
+        child.level = location.level
+        child._root = self._root
+        child._children = None
+        child._child_locs = None
+        child._value = _UNSET
+        return child
+
+    def _direct_child_locs(self) -> dict[str, tuple[LocationInfo, str]]:
         """
         Get direct child locations for the current context.
 
         Returns:
-            Dictionary mapping child names to their LocationInfo objects.
-            Only includes value children, not key metadata (e.g., excludes 'x.__key__')
+            Dictionary mapping child names to their (LocationInfo, absolute dot
+            path) pairs. Only includes value children, not key metadata
+            (e.g., excludes 'x.__key__')
+        """
+        # Locations never change after construction, so the per-node view is
+        # resolved once and reused by every later lookup/iteration
+        child_locs = self._child_locs
+        if child_locs is None:
+            child_locs = self._child_locs = self._children_index().get(
+                id(self.location), {}
+            )
+        return child_locs
+
+    def _children_index(self) -> dict[int, dict[str, tuple[LocationInfo, str]]]:
         """
-        out: dict[str, LocationInfo] = {}
-        me = self.location
-        for p, loc in self.locations.items():
-            if p.endswith(".__key__"):
-                continue
-            # direct child if my LocationInfo is the immediate parent (last in parents)
-            if loc.parents and loc.parents[-1] == me:
-                out[loc.key] = loc
-        return out
+        Get the index of direct children, keyed by the id() of their parent.
+
+        Built once in a single pass over the locations and kept on the root
+        context, so child lookups no longer scan the whole mapping. Each child
+        keeps its mapping key as its path, so descending never rebuilds paths.
+
+        Returns:
+            Mapping of parent LocationInfo id to {child name: (LocationInfo, path)}
+        """
+        root = self._root
+        index = root._children
+        if index is None:
+            index = {}
+            for p, loc in self.locations.items():
+                if loc.parent is None or p.endswith(".__key__"):
+                    continue
+                # parents are the very objects stored in the mapping, so
+                # identity suffices
+                index.setdefault(id(loc.parent), {})[loc.key] = (loc, p)
+            root._children = index
+        return index
 
     def _loc_for_absolute_path(self, abs_path: str) -> LocationInfo:
         """
@@ -263,10 +502,8 @@ class TrackedJson:
         Raises:
             KeyError: If the path doesn't exist
         """
-        loc = self.locations.get(abs_path)
-        if not loc:
-            raise KeyError(abs_path)
-        return loc
+        # a missing path raises KeyError(abs_path) straight from the mapping
+        return self.locations[abs_path]
 
     def _abs_from_relative(self, rel: str) -> str:
         """
@@ -278,7 +515,7 @@ class TrackedJson:
         Returns:
             Absolute dot path (e.g., "$.user.name")
         """
-        if rel.startswith("$") or rel.startswith("/"):
+        if rel[:1] in _ABSOLUTE_PREFIXES:
             # already absolute (dot path or pointer) — normalize like before
             return self._normalize_path(rel)
         return (
@@ -291,58 +528,15 @@ class TrackedJson:
         """
         Normalize a user-supplied path into internal dot-path format.
 
-        Supports multiple path formats:
-        - "$" (root)
-        - "user.name" (dot path)
-        - "/user/name" (JSON Pointer)
-        - "name" (relative to current context)
-
         Args:
             path: Path to normalize
 
         Returns:
             Normalized dot path
         """
-        if not path:
-            return self.path
+        return _normalize_path(self.path, path)
 
-        # JSON Pointer → dot path
-        if path.startswith("/"):
-            return self._pointer_to_dot(path)
-
-        # already absolute
-        if path.startswith("$"):
-            return path
-
-        # relative path (e.g. "name" inside "$.user")
-        if self.path == "$":
-            return f"$.{path}"
-        return f"{self.path}.{path}"
-
-    @staticmethod
-    def _pointer_to_dot(ptr: str) -> str:
-        """
-        Convert a JSON Pointer (RFC 6901) to dot notation.
-
-        Examples:
-            ""            -> "$"
-            "/"           -> "$"
-            "/user/name"  -> "$.user.name"
-            "/items/0/id" -> "$.items.0.id"
-
-        Args:
-            ptr: JSON Pointer string
-
-        Returns:
-            Dot notation path
-        """
-        if not ptr or ptr == "/":
-            return "$"
-
-        parts = ptr.lstrip("/").split("/")
-        # unescape per RFC 6901: "~1" → "/", "~0" → "~"
-        decoded = [p.replace("~1", "/").replace("~0", "~") for p in parts]
-        return "$." + ".".join(decoded)
+    _pointer_to_dot = staticmethod(_pointer_to_dot)
 
     # ── Mapping dunders ────────────────────────────────────────────────────────
     def __getitem__(self, key: str | int) -> "TrackedJson":
@@ -365,27 +559,19 @@ class TrackedJson:
         """
         name = str(key)
         # allow absolute lookups like "user.name" from root instance
-        if name.startswith("$") or name.startswith("/"):
+        if name[:1] in _ABSOLUTE_PREFIXES:
             abs_path = self._normalize_path(name)
             loc = self._loc_for_absolute_path(abs_path)
-            return TrackedJson(
-                self.json_text, _locations=self.locations, _location=loc, _path=abs_path
-            )
+            return self._child(loc, abs_path)
 
         if self.location.kind == "string":
-            return self.to_value()[key]
+            return self._shared_value()[key]
 
         # hierarchical: only direct children
         child = self._direct_child_locs().get(name)
-        if not child:
+        if child is None:
             raise KeyError(name)
-        child_abs_path = (f"{self.path}.{name}") if self.path != "$" else "$." + name
-        return TrackedJson(
-            self.json_text,
-            _locations=self.locations,
-            _location=child,
-            _path=child_abs_path,
-        )
+        return self._child(*child)
 
     def __contains__(self, key: object) -> bool:
         """
@@ -407,9 +593,8 @@ class TrackedJson:
 
         name = str(key)
         # Check absolute paths (starting with "$" or "/")
-        if name.startswith("$") or name.startswith("/"):
-            abs_path = self._normalize_path(name)
-            return abs_path in self.locations
+        if name[:1] in _ABSOLUTE_PREFIXES:
+            return _normalize_path(self.path, name) in self.locations
 
         # Check direct children
         return name in self._direct_child_locs()
@@ -439,7 +624,7 @@ class TrackedJson:
         Returns:
             True if the data is truthy
         """
-        return bool(self.data)
+        return bool(self._shared_value())
 
     def __int__(self) -> int:
         """
@@ -451,7 +636,7 @@ class TrackedJson:
         Raises:
             ValueError: If the data cannot be converted to int
         """
-        return int(self.data)
+        return int(self._shared_value())
 
     def __float__(self) -> float:
         """
@@ -463,7 +648,7 @@ class TrackedJson:
         Raises:
             ValueError: If the data cannot be converted to float
         """
-        return float(self.data)
+        return float(self._shared_value())
 
     def __eq__(self, other: object) -> bool:
         """
@@ -475,7 +660,7 @@ class TrackedJson:
         Returns:
             True if the data equals the other value
         """
-        return self.data == other
+        return self._shared_value() == other
 
     def __ne__(self, other: object) -> bool:
         """
@@ -487,7 +672,7 @@ class TrackedJson:
         Returns:
             True if the data is not equal to the other value
         """
-        return self.data != other
+        return self._shared_value() != other
 
     def __str__(self) -> str:
         """
@@ -496,7 +681,7 @@ class TrackedJson:
         Returns:
             String representation of the data
         """
-        return str(self.data)
+        return str(self._shared_value())
 
     # dict-like convenience (hierarchical)
     def keys(self) -> Iterable[str]:
@@ -515,17 +700,8 @@ class TrackedJson:
         Returns:
             Iterable of (key, TrackedJson) tuples
         """
-        for name, loc in self._direct_child_locs().items():
-            abs_path = (f"{self.path}.{name}") if self.path != "$" else "$." + name
-            yield (
-                name,
-                TrackedJson(
-                    self.json_text,
-                    _locations=self.locations,
-                    _location=loc,
-                    _path=abs_path,
-                ),
-            )
+        for name, (loc, abs_path) in self._direct_child_locs().items():
+            yield name, self._child(loc, abs_path)
 
     def values(self) -> Iterable["TrackedJson"]:
         """
@@ -560,8 +736,8 @@ class TrackedJson:
         Returns:
             String showing the status, path, location, and value
         """
-        kind = "OK" if self.data is not None else "SYNTAX_ERROR"
-        return f"TrackedJson<{kind}> path={self.path!r} loc=[{self.start}:{self.end}] value={self.data!r}"
+        kind = "OK" if self._shared_value() is not None else "SYNTAX_ERROR"
+        return f"TrackedJson<{kind}> path={self.path!r} loc=[{self.start}:{self.end}] value={self._shared_value()!r}"
 
     @property
     def start(self) -> int:
@@ -597,15 +773,68 @@ class TrackedJson:
         """
         Parse and return the Python value for the current element.
 
+        The whole document is parsed once, on the root; child values are
+        found by walking down from the root value along the node's key chain
+        instead of re-parsing the node's slice of the text. Objects and arrays
+        are returned as fresh copies, so callers may modify the result without
+        affecting this node, its parents or later calls.
+
         Returns:
             Python object (dict, list, str, int, float, bool, None)
 
+        Raises:
+            TrackedJSONDecodeError: If the original JSON was invalid
+        """
+        value = self._shared_value()
+        if isinstance(value, (dict, list)):
+            # parsed values only hold JSON types, which orjson round-trips
+            # exactly and far faster than copy.deepcopy; it only refuses
+            # integers wider than 64 bits
+            try:
+                return orjson.loads(orjson.dumps(value))
+            except orjson.JSONEncodeError:
+                return copy.deepcopy(value)
+        return value
+
+    def _shared_value(self) -> Any:
+        """
+        Get the cached Python value for the current element, without copying.
+
+        Child values are shared with their parents' values, so the result
+        must only be read, never modified or handed out (see to_value).
+
         Raises:
             TrackedJSONDecodeError: If the original JSON was invalid
         """
         if self.error:
             raise self.error
-        return json.loads(self.to_string())
+        value = self._value
+        if value is _UNSET:
+            value = self._value = self._resolve_value()
+        return value
+
+    def _resolve_value(self) -> Any:
+        """
+        Compute the Python value for the current element.
+
+        Returns:
+            Python object (dict, list, str, int, float, bool, None)
+        """
+        loc = self.location
+        root = self._root
+        # The root parses its own text; key nodes (and the whole-text fallback
+        # location) are not reachable by descending through values
+        if root is self or loc.kind == "key":
+            return _loads_json(self.to_string())
+
+        value = root._shared_value()
+        if loc.parent is None:
+            return value
+        # parents[0] is the root; descend through the rest, then this node
+        for node in (*loc.parents[1:], loc):
+            key = node.key
+            value = value[int(key)] if isinstance(value, list) else value[key]
+        return value
 
     @property
     def data(self) -> Any:
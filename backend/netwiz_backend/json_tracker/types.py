@@ -1,21 +1,24 @@
+from dataclasses import dataclass
 from typing import Literal
 
-from pydantic import BaseModel, Field
-
 # ── Types ───────────────────────────────────────────────────────────────────────
 
 Kind = Literal["key", "object", "list", "null", "string", "boolean", "number"]
 
 
-class LocationInfo(BaseModel):
+@dataclass(slots=True, frozen=True)
+class LocationInfo:
     """
     Represents the location information for a JSON element in the source text.
 
     This class contains precise positioning data including character offsets,
     line/column numbers, and hierarchical relationships within the JSON structure.
+    It is a plain slotted dataclass rather than a validated model: instances are
+    only ever built from `json-source-map` output, which is already well typed.
+    Instances are frozen, so a node can be shared (as a parent, or across cached
+    mappings) without anyone changing it underneath the other holders.
 
     Attributes:
-        parents: List of parent LocationInfo objects from oldest to most recent
         key: The name/key of this element
         kind: The type of JSON element ("key", "object", "list", "null", "string", "boolean", "number")
         start_character_number: 1-based character position where element starts
@@ -24,48 +27,45 @@ class LocationInfo(BaseModel):
         end_character_number: 1-based character position where element ends
         end_line_number: 1-based line number where element ends
         end_line_character_number: 1-based column number where element ends
+        parent: The immediate parent LocationInfo (None for the root)
+        level: The nesting depth of this element (number of parents)
 
     Properties:
-        level: The nesting depth of this element (number of parents)
+        parents: Tuple of parent LocationInfo objects from oldest to most recent
     """
 
-    parents: list["LocationInfo"] = Field(
-        default_factory=list,
-        description="The parents from oldest first to most recent last",
-    )
-    key: str = Field(..., description="The name of this object")
-    kind: Kind = Field(..., description="The kind of object: key or value")
+    key: str
+    kind: Kind
 
     # 1-based absolute character offsets and line/column positions
-    start_character_number: int = Field(
-        ..., ge=1, description="Character number within the full text"
-    )
-    start_line_number: int = Field(
-        ..., ge=1, description="Line number within the full text"
-    )
-    start_line_character_number: int = Field(
-        ..., ge=1, description="Character number within the start line"
-    )
-
-    end_character_number: int = Field(
-        ..., ge=1, description="Character number within the full text"
-    )
-    end_line_number: int = Field(
-        ..., ge=1, description="Line number within the full text"
-    )
-    end_line_character_number: int = Field(
-        ..., ge=1, description="Character number within the end line"
-    )
+    start_character_number: int
+    start_line_number: int
+    start_line_character_number: int
+
+    end_character_number: int
+    end_line_number: int
+    end_line_character_number: int
+
+    # Only the immediate parent is stored; the ancestor chain is walked on
+    # demand, so building a node costs O(1) regardless of its depth
+    parent: "LocationInfo | None" = None
+    level: int = 0
 
     @property
-    def level(self) -> int:
+    def parents(self) -> tuple["LocationInfo", ...]:
         """
-        Get the nesting level of this element.
+        Get the ancestors of this element.
 
         Returns:
-            Number of parent elements (nesting depth)
+            Parent LocationInfo objects from oldest (the root) to most recent
         """
-        return len(self.parents)
+        chain = []
+        node = self.parent
+        while node is not None:
+            chain.append(node)
+            node = node.parent
+        chain.reverse()
+        return tuple(chain)
 
     def __hash__(self) -> int:
         """
@@ -74,7 +74,8 @@ class LocationInfo(BaseModel):
         Returns:
             Hash value based on the unique characteristics of this location
         """
-        # Use a combination of key characteristics that should be unique
+        # Only this node's own fields: equal locations always share them, so
+        # the hash stays consistent with __eq__ without walking the parents
         return hash(
             (
                 self.key,
@@ -85,9 +86,6 @@ class LocationInfo(BaseModel):
                 self.start_line_character_number,
                 self.end_line_number,
                 self.end_line_character_number,
-                tuple(
-                    p.key for p in self.parents
-                ),  # Convert parents to tuple for hashing
             )
         )
 
@@ -101,17 +99,22 @@ class LocationInfo(BaseModel):
         Returns:
             True if the objects represent the same location
         """
+        if self is other:
+            return True
         if not isinstance(other, LocationInfo):
-            return False
+            return NotImplemented
 
+        # Cheapest, most distinguishing fields first; the parent chain last,
+        # where a shared ancestor matches by identity before recursing
         return (
-            self.key == other.key
-            and self.kind == other.kind
-            and self.start_character_number == other.start_character_number
+            self.start_character_number == other.start_character_number
             and self.end_character_number == other.end_character_number
+            and self.key == other.key
+            and self.kind == other.kind
             and self.start_line_number == other.start_line_number
             and self.start_line_character_number == other.start_line_character_number
             and self.end_line_number == other.end_line_number
             and self.end_line_character_number == other.end_line_character_number
-            and self.parents == other.parents
+            and self.level == other.level
+            and self.parent == other.parent
         )
@@ -1,43 +1,87 @@
 # netwiz_backend/main.py
 from __future__ import annotations
 
+import logging
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import ClassVar
+
+import orjson
 import uvicorn
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.openapi.docs import (
+    get_redoc_html,
+    get_swagger_ui_html,
+    get_swagger_ui_oauth2_redirect_html,
+)
+from fastapi.responses import HTMLResponse, ORJSONResponse, Response
+from pythonjsonlogger import jsonlogger
 
-from netwiz_backend.auth.admin_init import ensure_admin_account_exists
-from netwiz_backend.auth.controller import AuthController
 from netwiz_backend.auth.middleware_auth import auth_middleware
-from netwiz_backend.auth.repository import get_auth_repository
-from netwiz_backend.config import settings
+from netwiz_backend.config import get_settings
 from netwiz_backend.database import close_database, init_database
-from netwiz_backend.models import ErrorResponse
-from netwiz_backend.netlist.controller import NetlistController
-from netwiz_backend.system.controller import SystemController
+
+logger = logging.getLogger(__name__)
+
+# "details" payloads for the common HTTP error codes, shared across responses
+# (they are only ever serialized, never modified)
+_STATUS_CODE_DETAILS = {
+    code: {"status_code": code}
+    for code in (400, 401, 403, 404, 409, 422, 429, 500, 502, 503)
+}
 
 
 class NetwizApp:
     """Top-level FastAPI application manager (static/class methods where sensible)."""
 
+    # the app built by get_app(); construction registers every route and
+    # builds their models, so it is done once per process
+    _cached_app: ClassVar[FastAPI | None] = None
+
     # ── construction ───────────────────────────────────────────────────────────
     def __init__(self) -> None:
+        self._configure_logging()
         self.app = self._create_app()
         self._configure_middleware()
         self._register_controllers()
-        self._register_lifecycle()
+        self._register_docs()
         self._register_exception_handlers()
 
+    @staticmethod
+    def _configure_logging() -> None:
+        # Route the package's loggers through one handler honoring LOG_LEVEL /
+        # LOG_FORMAT; uvicorn keeps managing its own loggers
+        settings = get_settings()
+        logger = logging.getLogger("netwiz_backend")
+        if logger.handlers:
+            return
+
+        handler = logging.StreamHandler()
+        fmt = "%(asctime)s %(levelname)s %(name)s %(message)s"
+        if settings.log_format == "json":
+            handler.setFormatter(jsonlogger.JsonFormatter(fmt))
+        else:
+            handler.setFormatter(logging.Formatter(fmt))
+        logger.addHandler(handler)
+        logger.setLevel(settings.log_level.upper())
+        logger.propagate = False
+
     @staticmethod
     def _create_app() -> FastAPI:
+        settings = get_settings()
         return FastAPI(
             title=settings.app_name,
             description=settings.app_description,
             version=settings.app_version,
-            docs_url="/docs",
-            redoc_url="/redoc",
+            # served by _register_docs, which encodes the schema only once
+            docs_url=None,
+            redoc_url=None,
             debug=settings.debug,
-            openapi_url="/openapi.json",
+            openapi_url=None,
+            lifespan=NetwizApp.lifespan,
+            # orjson serializes response bodies several times faster than stdlib json
+            default_response_class=ORJSONResponse,
             openapi_tags=[
                 {
                     "name": "auth",
@@ -65,7 +109,7 @@ class NetwizApp:
         # Add CORS middleware
         self.app.add_middleware(
             CORSMiddleware,
-            allow_origins=settings.cors_origins,
+            allow_origins=get_settings().cors_origin_list,
             allow_credentials=True,
             allow_methods=["*"],
             allow_headers=["*"],
@@ -75,6 +119,12 @@ class NetwizApp:
         self.app.middleware("http")(auth_middleware)
 
     def _register_controllers(self) -> None:
+        # Imported here: the controllers pull in the route model graphs, which
+        # only an app that is actually being built needs
+        from netwiz_backend.auth.controller import AuthController
+        from netwiz_backend.netlist.controller import NetlistController
+        from netwiz_backend.system.controller import SystemController
+
         # Register auth controller
         auth_controller = AuthController(prefix="/auth")
         auth_controller.register(self.app)
@@ -90,10 +140,45 @@ class NetwizApp:
             auth_controller=auth_controller,
         ).register(self.app)
 
-    def _register_lifecycle(self) -> None:
-        # static: they don’t depend on instance state
-        self.app.add_event_handler("startup", NetwizApp.on_startup)
-        self.app.add_event_handler("shutdown", NetwizApp.on_shutdown)
+    def _register_docs(self) -> None:
+        # FastAPI caches the schema dict but re-encodes it on every request to
+        # its own /openapi.json route. Routes are fixed once registered, so the
+        # schema is encoded on first request and the bytes are reused; the docs
+        # pages are registered here too, since FastAPI only adds them together
+        # with its own openapi route.
+        app = self.app
+        openapi_url = "/openapi.json"
+        oauth2_redirect_url = app.swagger_ui_oauth2_redirect_url
+        schema_bytes: bytes | None = None
+
+        async def openapi(request: Request) -> Response:
+            nonlocal schema_bytes
+            if schema_bytes is None:
+                schema_bytes = orjson.dumps(app.openapi())
+            return Response(schema_bytes, media_type="application/json")
+
+        async def swagger_ui(request: Request) -> HTMLResponse:
+            return get_swagger_ui_html(
+                openapi_url=openapi_url,
+                title=f"{app.title} - Swagger UI",
+                oauth2_redirect_url=oauth2_redirect_url,
+                init_oauth=app.swagger_ui_init_oauth,
+                swagger_ui_parameters=app.swagger_ui_parameters,
+            )
+
+        async def swagger_ui_redirect(request: Request) -> HTMLResponse:
+            return get_swagger_ui_oauth2_redirect_html()
+
+        async def redoc(request: Request) -> HTMLResponse:
+            return get_redoc_html(openapi_url=openapi_url, title=f"{app.title} - ReDoc")
+
+        app.add_route(openapi_url, openapi, include_in_schema=False)
+        app.add_route("/docs", swagger_ui, include_in_schema=False)
+        if oauth2_redirect_url:
+            app.add_route(
+                oauth2_redirect_url, swagger_ui_redirect, include_in_schema=False
+            )
+        app.add_route("/redoc", redoc, include_in_schema=False)
 
     def _register_exception_handlers(self) -> None:
         # static: don’t depend on instance state
@@ -101,69 +186,105 @@ class NetwizApp:
         self.app.add_exception_handler(Exception, NetwizApp.general_exception_handler)
 
     # ── lifecycle (static) ─────────────────────────────────────────────────────
+    @staticmethod
+    @asynccontextmanager
+    async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+        # replaces the deprecated startup/shutdown event handlers
+        await NetwizApp.on_startup()
+        try:
+            yield
+        finally:
+            await NetwizApp.on_shutdown()
+
     @staticmethod
     async def on_startup() -> None:
         try:
             await init_database()
-            print("✅ Database initialization completed")
-        except Exception as e:
-            print(f"⚠️  Database initialization failed: {e}")
-            print("⚠️  Application will continue without database connection")
+            logger.info("Database initialization completed")
+        except Exception:
+            logger.exception(
+                "Database initialization failed; continuing without a database"
+            )
             return
 
-        # Ensure admin account exists
+        from netwiz_backend.auth.admin_init import ensure_admin_account_exists
+        from netwiz_backend.auth.repository import get_auth_repository
+        from netwiz_backend.database import get_database
+        from netwiz_backend.netlist.repository import get_netlist_repository
+
+        database = await get_database()
+        auth_repo = get_auth_repository(database)
+
+        # The unique user indexes are the only guard against duplicate
+        # signups, so the app must not serve requests without them
         try:
-            from netwiz_backend.database import get_database
+            await auth_repo.ensure_indexes()
+            await get_netlist_repository(database).ensure_indexes()
+        except Exception:
+            logger.exception("Index creation failed; refusing to start")
+            raise
 
-            async for database in get_database():
-                auth_repo = get_auth_repository(database)
-                await ensure_admin_account_exists(auth_repo)
-                break
-            print("✅ Admin account initialization completed")
-        except Exception as e:
-            print(f"⚠️  Admin account initialization failed: {e}")
-            print("⚠️  Application will continue without admin account setup")
+        # Ensure admin account exists
+        try:
+            await ensure_admin_account_exists(auth_repo)
+            logger.info("Admin account initialization completed")
+        except Exception:
+            logger.exception(
+                "Admin account initialization failed; continuing without it"
+            )
 
     @staticmethod
     async def on_shutdown() -> None:
-        await close_database()
+        from netwiz_backend.netlist.repository import flush_deferred_inserts
+
+        try:
+            await flush_deferred_inserts()
+        finally:
+            await close_database()
 
     # ── exception handlers (static) ────────────────────────────────────────────
     @staticmethod
     async def http_exception_handler(
         request: Request, exc: HTTPException
-    ) -> JSONResponse:
+    ) -> ORJSONResponse:
         if isinstance(exc.detail, dict) and "validation_result" in exc.detail:
-            return JSONResponse(status_code=exc.status_code, content=exc.detail)
-        return JSONResponse(
+            return ORJSONResponse(status_code=exc.status_code, content=exc.detail)
+        # Same shape as ErrorResponse, built directly: the handler's own inputs
+        # need no validation pass
+        detail = str(exc.detail)
+        return ORJSONResponse(
             status_code=exc.status_code,
-            content=ErrorResponse(
-                error=str(exc.detail),
-                message=str(exc.detail),
-                details={"status_code": exc.status_code},
-            ).model_dump(),
+            content={
+                "error": detail,
+                "message": detail,
+                "details": _STATUS_CODE_DETAILS.get(exc.status_code)
+                or {"status_code": exc.status_code},
+            },
         )
 
     @staticmethod
     async def general_exception_handler(
         request: Request, exc: Exception
-    ) -> JSONResponse:
-        return JSONResponse(
+    ) -> ORJSONResponse:
+        return ORJSONResponse(
             status_code=500,
-            content=ErrorResponse(
-                error="internal_server_error",
-                message="An internal server error occurred",
-                details={"exception": str(exc)},
-            ).model_dump(),
+            content={
+                "error": "internal_server_error",
+                "message": "An internal server error occurred",
+                "details": {"exception": str(exc)},
+            },
         )
 
     # ── public factories/runners (class methods) ───────────────────────────────
     @classmethod
     def get_app(cls) -> FastAPI:
-        return cls().app
+        if cls._cached_app is None:
+            cls._cached_app = cls().app
+        return cls._cached_app
 
     @classmethod
     def run(cls) -> None:
+        settings = get_settings()
         uvicorn.run(
             "netwiz_backend.main:app",  # or "netwiz_backend.main:NetwizApp.get_app"
             host=settings.host,
@@ -1,17 +1,20 @@
 from typing import Any
 
-from pydantic import BaseModel, Field, constr
+from pydantic import BaseModel, Field
 
 # Response Models
+#
+# The shared models defer their validator/serializer build until first use, so
+# importing this module does not pay for schemas a process may never need.
 
 
 class ErrorResponse(BaseModel):
     """Standard error response model"""
 
-    error: constr(strip_whitespace=True) = Field(..., description="Error type")
-    message: constr(strip_whitespace=True) = Field(
-        ..., description="Human-readable error message"
-    )
+    model_config = {"defer_build": True}
+
+    error: str = Field(..., description="Error type")
+    message: str = Field(..., description="Human-readable error message")
     details: dict[str, Any] | None = Field(
         default=None, description="Additional error details"
     )
@@ -23,6 +26,8 @@ class ErrorResponse(BaseModel):
 class PaginationParams(BaseModel):
     """Pagination parameters for list endpoints"""
 
+    model_config = {"defer_build": True}
+
     page: int = Field(default=1, ge=1, description="Page number (1-based)")
     page_size: int = Field(
         default=10, ge=1, le=100, description="Number of items per page"
@@ -32,6 +37,8 @@ class PaginationParams(BaseModel):
 class PaginatedResponse(BaseModel):
     """Response model for listing netlists"""
 
+    model_config = {"defer_build": True}
+
     total_count: int = Field(..., description="Total number of submissions")
     page: int = Field(..., description="Current page number")
     page_size: int = Field(..., description="Number of items per page")
@@ -1,10 +1,23 @@
 # netwiz_backend/netlist/controller.py
+import asyncio
 import uuid
+from collections.abc import AsyncIterator
+from datetime import datetime
 from typing import ClassVar
 
-from fastapi import APIRouter, Depends, File, HTTPException, Query, UploadFile, status
+from fastapi import (
+    APIRouter,
+    Depends,
+    File,
+    HTTPException,
+    Query,
+    Response,
+    UploadFile,
+    status,
+)
+from fastapi.responses import StreamingResponse
 from motor.core import AgnosticDatabase
-from pydantic import UUID4
+from pydantic import UUID4, BaseModel
 
 from netwiz_backend.auth.decorators import AUTH, PUBLIC
 from netwiz_backend.auth.middleware import get_current_active_user
@@ -13,16 +26,75 @@ from netwiz_backend.controller_abc import RouteControllerABC
 from netwiz_backend.database import get_database
 from netwiz_backend.models import PaginationParams
 from netwiz_backend.netlist.core.models import Netlist, TrackedNetlist
-from netwiz_backend.netlist.core.validation import validate_netlist
+from netwiz_backend.netlist.core.validation import ValidationResult, validate_netlist
 from netwiz_backend.netlist.models import (
     NetlistEndpoints,
+    NetlistListCursor,
     NetlistListResponse,
     NetlistSubmission,
 )
-from netwiz_backend.netlist.repository import get_netlist_repository
+from netwiz_backend.netlist.repository import (
+    NetlistRepository,
+    get_netlist_repository,
+)
 from netwiz_backend.tools import get_pagination_params
 
 
+async def get_repository(
+    database: AgnosticDatabase = Depends(get_database),
+) -> NetlistRepository:
+    """Dependency to get the netlist repository for the app database"""
+    return get_netlist_repository(database)
+
+
+def _json_response(
+    model: BaseModel, status_code: int = status.HTTP_200_OK
+) -> Response:
+    """
+    Respond with a model serialized straight to JSON bytes.
+
+    A returned Response bypasses FastAPI's response_model handling, which dumps
+    the model to dicts, validates those against the response_model and encodes
+    the result again; pydantic-core writes the JSON in a single pass instead.
+    Routes keep their response_model for the OpenAPI schema.
+    """
+    return Response(
+        model.model_dump_json(), status_code=status_code, media_type="application/json"
+    )
+
+
+def _decode_and_validate(
+    content: bytes,
+) -> tuple[str, tuple[dict | Netlist | TrackedNetlist | None, ValidationResult]]:
+    """Decode an uploaded file and validate it (CPU-bound; run off the event loop)."""
+    json_text = content.decode("utf-8")
+    return json_text, validate_netlist(json_text)
+
+
+def _listing_owner(
+    current_user: User, user_id: UUID4 | None, list_all: bool
+) -> str | None:
+    """
+    Resolve whose netlists a listing covers (None for everyone's).
+
+    Admins may list everything or pick a user; everyone else only lists their
+    own netlists.
+
+    Raises:
+        HTTPException: 403 if a non-admin asks for all or another user's netlists
+    """
+    # user_id is a UUID, User.id (and the stored user_id) its string form
+    owner_id = None if user_id is None else str(user_id)
+    if not current_user.is_admin and (
+        list_all or (owner_id is not None and owner_id != current_user.id)
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Access denied: You can only view your own netlists",
+        )
+    return None if list_all else owner_id or current_user.id
+
+
 class NetlistController(RouteControllerABC):
     """
     Class-organized FastAPI controller for /netlist endpoints.
@@ -32,13 +104,24 @@ class NetlistController(RouteControllerABC):
     tags: ClassVar[list[str]] = ["netlist"]
 
     def _register_routes(self, router: APIRouter):
-        # Register routes
+        # Register routes. Each handler takes current_user from
+        # get_current_active_user, which is what requires authentication
+        # Registered before "/{submission_id}", which would otherwise match it
+        router.add_api_route(
+            "/stream",
+            self.stream_netlists,
+            methods=["GET"],
+            response_class=StreamingResponse,
+            openapi_extra={
+                "description": "Stream netlist submission summaries as NDJSON, one per line, followed by a {\"total_count\": n} line. Same filters and permissions as the list endpoint, without pagination."
+            },
+        )
+
         router.add_api_route(
             "/{submission_id}",
             self.get_netlist,
             methods=["GET"],
             response_model=NetlistSubmission,
-            dependencies=[Depends(get_current_active_user)],
             openapi_extra={
                 "description": "Retrieve a specific netlist submission. Users can only access their own netlists unless they are admin."
             },
@@ -49,7 +132,6 @@ class NetlistController(RouteControllerABC):
             self.list_netlists,
             methods=["GET"],
             response_model=NetlistListResponse,
-            dependencies=[Depends(get_current_active_user)],
             openapi_extra={
                 "description": "List netlist submissions. Users see only their own netlists by default. Admins can use list_all=true or user_id parameter."
             },
@@ -61,7 +143,12 @@ class NetlistController(RouteControllerABC):
             methods=["POST"],
             response_model=NetlistSubmission,
             status_code=status.HTTP_201_CREATED,
-            dependencies=[Depends(get_current_active_user)],
+            responses={
+                status.HTTP_202_ACCEPTED: {
+                    "model": NetlistSubmission,
+                    "description": "Accepted with durable=false; the submission is stored in the background",
+                }
+            },
             openapi_extra={
                 "description": "Upload netlist as JSON file. Accepts multipart/form-data with file field."
             },
@@ -75,6 +162,7 @@ class NetlistController(RouteControllerABC):
             upload_data=f"{self.prefix}/upload/data",
             upload_text=f"{self.prefix}/upload/text",
             list=self.prefix,
+            stream=f"{self.prefix}/stream",
             get=f"{self.prefix}/{{submission_id}}",
         )
 
@@ -83,41 +171,39 @@ class NetlistController(RouteControllerABC):
     async def get_netlist(
         self,
         submission_id: str,
-        database: AgnosticDatabase = Depends(get_database),
+        repo: NetlistRepository = Depends(get_repository),
         current_user: User = Depends(get_current_active_user),
-    ) -> NetlistSubmission:
+    ) -> Response:
         """
         Retrieve a specific netlist submission by ID.
 
         Fetches a previously uploaded netlist submission from the database using its
         unique submission ID. Users can only access their own netlists unless they are admin.
         """
-        repo = get_netlist_repository(database)
-        submission = await repo.get_by_id(submission_id)
+        # Ownership is checked by the query itself: admins look up any
+        # submission, everyone else only their own (stored as a string)
+        owner_id = None if current_user.is_admin else str(current_user.id)
+        submission = await repo.get_by_id_for_user(submission_id, owner_id)
         if not submission:
+            # Only a miss pays for a second, ID-only lookup, which tells
+            # someone else's submission (403) from a missing one (404)
+            if owner_id is not None and await repo.exists(submission_id):
+                raise HTTPException(
+                    status_code=status.HTTP_403_FORBIDDEN,
+                    detail="Access denied: You can only view your own netlists",
+                )
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Netlist submission with ID '{submission_id}' not found",
             )
 
-        # Check access permissions: user must be owner or admin
-        if (
-            str(submission.user_id) != str(current_user.id)
-            and current_user.user_type.value != "admin"
-        ):
-            print(current_user.id, current_user.username, submission.user_id)
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="Access denied: You can only view your own netlists",
-            )
-
-        return submission
+        return _json_response(submission)
 
     @AUTH
     async def list_netlists(
         self,
         pagination: PaginationParams = Depends(get_pagination_params),
-        database: AgnosticDatabase = Depends(get_database),
+        repo: NetlistRepository = Depends(get_repository),
         current_user: User = Depends(get_current_active_user),
         user_id: UUID4 | None = Query(
             default=None, description="Filter by user ID (admin only)"
@@ -125,51 +211,98 @@ class NetlistController(RouteControllerABC):
         list_all: bool = Query(
             default=False, description="List all netlists (admin only)"
         ),
-    ) -> NetlistListResponse:
+        after_timestamp: datetime | None = Query(
+            default=None,
+            description="List submissions after this cursor (next_cursor of the previous page)",
+        ),
+        after_id: UUID4 | None = Query(
+            default=None,
+            description="List submissions after this cursor (next_cursor of the previous page)",
+        ),
+    ) -> Response:
         """
         List netlist submissions with pagination and optional filtering.
 
         Retrieves a paginated list of netlist submissions from the database.
         By default, users only see their own netlists. Admins can use list_all=true
-        to see all netlists or user_id to filter by specific user.
+        to see all netlists or user_id to filter by specific user. Pass the
+        previous page's next_cursor as after_timestamp/after_id to page deeply;
+        page numbers still work but get slower the further in they go.
         """
 
-        # Determine which netlists to show based on user permissions
-        if current_user.user_type.value != "admin" and (
-            list_all or (user_id is not None and user_id != current_user.id)
-        ):
+        owner_id = _listing_owner(current_user, user_id, list_all)
+
+        if (after_timestamp is None) != (after_id is None):
             raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="Access denied: You can only view your own netlists",
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail="after_timestamp and after_id must be given together",
+            )
+        after = None
+        if after_timestamp is not None:
+            after = NetlistListCursor(submission_timestamp=after_timestamp, id=after_id)
+
+        submissions, total_count, next_cursor = await repo.list(
+            owner_id, pagination=pagination, after=after
+        )
+        return _json_response(
+            NetlistListResponse(
+                submissions=submissions,
+                total_count=total_count,
+                page=pagination.page,
+                page_size=pagination.page_size,
+                next_cursor=next_cursor,
             )
-        elif list_all:
-            # Admin can list all netlists
-            filters = {}
-        else:
-            # Admin can filter by specific user
-            filters = {"user_id": user_id or current_user.id}
-
-        repo = get_netlist_repository(database)
-        submissions, total_count = await repo.list(pagination=pagination, **filters)
-        return NetlistListResponse(
-            submissions=submissions,
-            total_count=total_count,
-            page=pagination.page,
-            page_size=pagination.page_size,
         )
 
+    @AUTH
+    async def stream_netlists(
+        self,
+        repo: NetlistRepository = Depends(get_repository),
+        current_user: User = Depends(get_current_active_user),
+        user_id: UUID4 | None = Query(
+            default=None, description="Filter by user ID (admin only)"
+        ),
+        list_all: bool = Query(
+            default=False, description="List all netlists (admin only)"
+        ),
+    ) -> StreamingResponse:
+        """
+        Stream netlist submission summaries as newline-delimited JSON.
+
+        Writes one summary per line, newest first, as the database returns
+        them, then a final {"total_count": n} line. Suited to bulk consumers:
+        the first rows go out before the rest are read, and the full listing
+        is never held in memory.
+        """
+        owner_id = _listing_owner(current_user, user_id, list_all)
+
+        async def lines() -> AsyncIterator[str]:
+            total_count = 0
+            async for summary in repo.iter_summaries(owner_id):
+                total_count += 1
+                yield summary.model_dump_json() + "\n"
+            yield f'{{"total_count": {total_count}}}\n'
+
+        return StreamingResponse(lines(), media_type="application/x-ndjson")
+
     @AUTH
     async def upload_netlist(
         self,
         file: UploadFile = File(..., description="JSON file containing netlist data"),
-        database: AgnosticDatabase = Depends(get_database),
+        durable: bool = Query(
+            default=True,
+            description="Wait for the database to confirm the write; with false the submission is stored in the background and 202 is returned",
+        ),
+        repo: NetlistRepository = Depends(get_repository),
         current_user: User = Depends(get_current_active_user),
-    ) -> NetlistSubmission:
+    ) -> Response:
         """
         Upload and validate a netlist from a JSON file.
 
         Accepts a JSON file upload via multipart/form-data.
-        The file should contain valid netlist JSON data.
+        The file should contain valid netlist JSON data. With durable=false
+        the response does not wait for the write, and the submission may take
+        a moment to appear in lookups and listings.
         """
         # Validate file type
         if not file.filename or not file.filename.lower().endswith(".json"):
@@ -180,11 +313,15 @@ class NetlistController(RouteControllerABC):
 
         # Read file content
         content = await file.read()
-        json_text = content.decode("utf-8")
         filename = file.filename
 
-        submission_id = str(uuid.uuid4())
-        tracked_netlist, validation_result = validate_netlist(json_text)
+        # Passed as a UUID: the model accepts it as-is, with no string re-parse
+        submission_id = uuid.uuid4()
+        # Parsing, location mapping and rule checks scale with the upload size,
+        # so they run in a worker thread instead of stalling other requests
+        json_text, (tracked_netlist, validation_result) = await asyncio.to_thread(
+            _decode_and_validate, content
+        )
         netlist = (
             Netlist(
                 components=tracked_netlist.components,
@@ -206,7 +343,9 @@ class NetlistController(RouteControllerABC):
             validation_result=validation_result,
         )
 
-        repo = get_netlist_repository(database)
-        await repo.create(submission)
+        if durable:
+            await repo.create(submission)
+            return _json_response(submission, status.HTTP_201_CREATED)
 
-        return submission
+        repo.create_deferred(submission)
+        return _json_response(submission, status.HTTP_202_ACCEPTED)
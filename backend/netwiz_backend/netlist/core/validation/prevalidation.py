@@ -1,5 +1,9 @@
+import re
+
+import orjson
 import pydantic_core
 
+from netwiz_backend.config import get_settings
 from netwiz_backend.json_tracker import TrackedJson, TrackedJSONDecodeError
 from netwiz_backend.netlist.core.models import TrackedNetlist
 from netwiz_backend.netlist.core.validation.types import (
@@ -16,6 +20,10 @@ preapplied_rules = [
     MISSING_FIELD,
 ]
 
+# Matches every text whose top-level value could be an object (JSON whitespace
+# is a subset of \s); anything else can never be a netlist
+_OBJECT_START = re.compile(r"\s*\{")
+
 
 def validate_basic_format(
     json_text: str,
@@ -41,10 +49,28 @@ def check_is_valid_json(
     json_text: str, validation_rules_applied: list
 ) -> tuple[TrackedJson | None, ValidationResult | None]:
     """Get ValidationRequest with custom pre-validation"""
+    validation_rules_applied.append(INVALID_JSON)
+
+    # Step 0: a document that doesn't start with "{" can't be an object; if it
+    # parses, reject it before paying for the location mapping (syntax errors
+    # still go through TrackedJson below for their location)
+    if not _OBJECT_START.match(json_text):
+        try:
+            orjson.loads(json_text)
+        except orjson.JSONDecodeError:
+            pass
+        else:
+            return None, _not_an_object(validation_rules_applied)
+
+    # Location self-checks are a development aid; skip them in production.
+    # Read before parsing, so a settings error is not reported as bad JSON.
+    self_test = get_settings().debug
+
     # Step 1: Parse JSON using TrackedJson (primary and only JSON parser)
     try:
-        validation_rules_applied.append(INVALID_JSON)
-        tracked_json = TrackedJson.loads(json_text, raise_on_error=True)
+        tracked_json = TrackedJson.loads(
+            json_text, raise_on_error=True, self_test=self_test
+        )
     except TrackedJSONDecodeError as e:
         # JSON syntax error - TrackedJson provides detailed location info
         return None, ValidationResult(
@@ -74,20 +100,24 @@ def check_is_valid_json(
 
     # Step 2: Check if data is a dict
     if not isinstance(tracked_json.data, dict):
-        return None, ValidationResult(
-            is_valid=False,
-            errors=[
-                NetlistValidationError(
-                    message="Request data must be an object",
-                    error_type=INVALID_JSON,
-                    location=None,
-                )
-            ],
-            validation_rules_applied=validation_rules_applied,
-        )
+        return None, _not_an_object(validation_rules_applied)
     return tracked_json, None
 
 
+def _not_an_object(validation_rules_applied: list) -> ValidationResult:
+    return ValidationResult(
+        is_valid=False,
+        errors=[
+            NetlistValidationError(
+                message="Request data must be an object",
+                error_type=INVALID_JSON,
+                location=None,
+            )
+        ],
+        validation_rules_applied=validation_rules_applied,
+    )
+
+
 def check_basic_format(
     tracked_json: TrackedJson, validation_rules_applied: list
 ) -> tuple[TrackedNetlist | None, ValidationResult | None]:
@@ -79,15 +79,8 @@ class RuleCheckABC(ABC):
         )
         errors = errors if errors is not None else []
         warnings = warnings if warnings is not None else []
-        get_location = get_location or (lambda x: None)
 
-        # mark the rule as applied
-        validation_rules_applied.extend(
-            [t for t in self.error_types if t not in validation_rules_applied]
-        )
-
-        # we are taking advantage of the mutability of the lists
-        self._check(netlist, errors, warnings, get_location)
+        self.apply(netlist, validation_rules_applied, errors, warnings, get_location)
 
         return ValidationResult(
             is_valid=len(errors) == 0,
@@ -97,6 +90,35 @@ class RuleCheckABC(ABC):
             validation_rules_applied=validation_rules_applied,
         )
 
+    def apply(
+        self,
+        netlist: Netlist,
+        validation_rules_applied: list[ValidationErrorType],
+        errors: list[NetlistValidationError],
+        warnings: list[NetlistValidationError],
+        get_location: Callable[[str], LocationInfo | None] | None = None,
+    ) -> None:
+        """
+        Run the check, recording its results into the provided lists only.
+
+        Unlike check(), no per-rule ValidationResult is built, so callers that
+        run many rules and assemble one combined result skip that work.
+
+        Args:
+            netlist: The netlist to validate
+            validation_rules_applied: List to append this rule's error_types to
+            errors: List to append error NetlistValidationError objects to
+            warnings: List to append warning NetlistValidationError objects to
+            get_location: Optional function to get location info for error positioning
+        """
+        # mark the rule as applied
+        validation_rules_applied.extend(
+            [t for t in self.error_types if t not in validation_rules_applied]
+        )
+
+        # we are taking advantage of the mutability of the lists
+        self._check(netlist, errors, warnings, get_location or (lambda x: None))
+
     @abstractmethod
     def _check(
         self,
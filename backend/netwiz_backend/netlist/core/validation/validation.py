@@ -58,6 +58,20 @@ from netwiz_backend.netlist.core.validation.types import (
     ValidationResult,
 )
 
+# The rules hold no per-netlist state, so one set of instances serves every call
+_VALIDATION_RULES = (
+    BlankComponentNameRule(),
+    BlankNetNameRule(),
+    UniqueComponentNameRule(),
+    UniqueNetNameRule(),
+    UniqueNameAcrossTypesRule(),
+    GroundConnectivityRule(),
+    GroundPinConnectivityRule(),
+    MisnamedNetsRule(),
+    OrphanedNetsRule(),
+    UnconnectedComponentsRule(),
+)
+
 
 def validate_netlist(
     netlist: str | dict | Netlist | TrackedNetlist,
@@ -150,23 +164,10 @@ def _validate_netlist(
     warnings = []
     validation_rules_applied = [*preapplied_rules]
 
-    # Initialize all validation rules
-    validation_rules = [
-        BlankComponentNameRule(),
-        BlankNetNameRule(),
-        UniqueComponentNameRule(),
-        UniqueNetNameRule(),
-        UniqueNameAcrossTypesRule(),
-        GroundConnectivityRule(),
-        GroundPinConnectivityRule(),
-        MisnamedNetsRule(),
-        OrphanedNetsRule(),
-        UnconnectedComponentsRule(),
-    ]
-
-    # Run all validation rules
-    for rule in validation_rules:
-        rule.check(netlist, validation_rules_applied, errors, warnings, get_location)
+    # Run all validation rules into the shared lists; the combined result is
+    # built once below
+    for rule in _VALIDATION_RULES:
+        rule.apply(netlist, validation_rules_applied, errors, warnings, get_location)
 
     return netlist, ValidationResult(
         is_valid=len(errors) == 0,
@@ -35,12 +35,40 @@ class NetlistSubmission(BaseModel):
     )
 
 
+class NetlistSubmissionSummary(BaseModel):
+    """Submission metadata shown in listings (no source text or netlist data)"""
+
+    id: UUID4 = Field(..., description="Unique submission ID")
+    user_id: UUID4 | None = Field(None, description="User who submitted the netlist")
+    submission_timestamp: datetime = Field(
+        ..., description="When the netlist was submitted"
+    )
+    validation_result: ValidationResult | None = Field(
+        None, description="Validation result for this submission"
+    )
+    filename: str | None = Field(
+        None, description="Original filename if uploaded from file"
+    )
+
+
+class NetlistListCursor(BaseModel):
+    """Position after the last listed submission, for fetching the next page"""
+
+    submission_timestamp: datetime = Field(
+        ..., description="Timestamp of the last listed submission"
+    )
+    id: UUID4 = Field(..., description="ID of the last listed submission")
+
+
 class NetlistListResponse(PaginatedResponse):
     """Response model for listing netlists"""
 
-    submissions: list[NetlistSubmission] = Field(
+    submissions: list[NetlistSubmissionSummary] = Field(
         ..., description="List of netlist submissions"
     )
+    next_cursor: NetlistListCursor | None = Field(
+        None, description="Pass as after_timestamp/after_id to get the next page"
+    )
 
 
 class NetlistEndpoints(BaseModel):
@@ -56,4 +84,7 @@ class NetlistEndpoints(BaseModel):
         ..., description="Upload netlist json text"
     )
     list: constr(strip_whitespace=True) = Field(..., description="List endpoint")
+    stream: constr(strip_whitespace=True) = Field(
+        ..., description="Streaming list endpoint (NDJSON)"
+    )
     get: constr(strip_whitespace=True) = Field(..., description="Get endpoint")
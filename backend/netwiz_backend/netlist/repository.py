@@ -2,25 +2,140 @@
 Repository for netlist operations using dependency injection
 """
 
-from motor.core import AgnosticDatabase
-from pydantic import UUID4
+import asyncio
+import logging
+from collections.abc import AsyncIterator
+from datetime import datetime, timezone
+
+from cachetools import TTLCache
+from motor.core import AgnosticCollection, AgnosticDatabase
 
 from netwiz_backend.models import PaginationParams
-from netwiz_backend.netlist.models import NetlistSubmission
+from netwiz_backend.netlist.models import (
+    NetlistListCursor,
+    NetlistSubmission,
+    NetlistSubmissionSummary,
+)
+
+# Fields left out of listings: the list view only shows submission metadata,
+# and the source text and parsed netlist are most of every document's size
+_SUMMARY_PROJECTION = {"json_text": 0, "netlist": 0}
+
+# Documents fetched per round trip when streaming a listing
+_STREAM_BATCH_SIZE = 100
+
+# Listing order, newest first; the ID breaks ties so a cursor is unambiguous
+_RECENT_FIRST = [("submission_timestamp", -1), ("id", -1)]
+
+# Stored submission timestamps: fixed-width UTC ISO strings, so that Mongo's
+# string comparison orders them chronologically. Pydantic's JSON form drops
+# the fraction when it is zero ("...:00Z" sorts after "...:00.5Z").
+_TIMESTAMP_FORMAT = "%Y-%m-%dT%H:%M:%S.%fZ"
+
+# Owner user_id (None for all submissions) -> submission count, so paging
+# through a listing doesn't recount on every page. Uploads drop the entries
+# they affect, so the TTL only bounds drift from other writers.
+_count_cache: TTLCache[str | None, int] = TTLCache(maxsize=10_000, ttl=5)
+
+# Deferred inserts are written this long after the first one is queued, in
+# batches of at most this many documents
+_OUTBOX_FLUSH_DELAY = 0.05
+_OUTBOX_MAX_BATCH = 100
+
+# (collection, document) pairs queued by create_deferred, and the task that
+# writes them. Kept per process rather than per repository, so a repository
+# replaced after a reconnect cannot strand queued documents, and shutdown has
+# a single place to flush.
+_outbox: list[tuple[AgnosticCollection, dict]] = []
+_flush_task: asyncio.Task | None = None
+
+logger = logging.getLogger(__name__)
+
+
+def _stored_timestamp(timestamp: datetime) -> str:
+    """Format a timestamp the way submissions store it (naive means UTC)"""
+    if timestamp.tzinfo is not None:
+        timestamp = timestamp.astimezone(timezone.utc)
+    return timestamp.strftime(_TIMESTAMP_FORMAT)
+
+
+def _submission_doc(submission: NetlistSubmission) -> dict:
+    """Build the MongoDB document for a submission"""
+    doc = submission.model_dump(mode="json")
+    doc["submission_timestamp"] = _stored_timestamp(submission.submission_timestamp)
+    return doc
+
+
+def _forget_counts(docs: list[dict]) -> None:
+    """Drop the cached counts that newly written documents change"""
+    _count_cache.pop(None, None)
+    for doc in docs:
+        _count_cache.pop(doc["user_id"], None)
+
+
+async def _flush_later() -> None:
+    global _flush_task
+    # _write_outbox() keeps writing until the outbox is empty, so anything
+    # queued while this task runs is written by it
+    try:
+        await asyncio.sleep(_OUTBOX_FLUSH_DELAY)
+        await _write_outbox()
+    finally:
+        _flush_task = None
+
+
+async def _write_outbox() -> None:
+    """Write the queued documents in batches, one insert_many per collection"""
+    while _outbox:
+        batch = _outbox[:_OUTBOX_MAX_BATCH]
+        del _outbox[:_OUTBOX_MAX_BATCH]
+        by_collection: dict[int, tuple[AgnosticCollection, list[dict]]] = {}
+        for collection, doc in batch:
+            by_collection.setdefault(id(collection), (collection, []))[1].append(doc)
+        for collection, docs in by_collection.values():
+            try:
+                # acknowledged, so a failed write is raised and logged here
+                await collection.insert_many(docs, ordered=False)
+            except Exception:
+                logger.exception("deferred insert of %d netlists failed", len(docs))
+            # counts are dropped once the write has landed (an unordered
+            # insert may have written part of a failed batch too)
+            _forget_counts(docs)
 
 
 class NetlistRepository:
     """Repository for netlist operations with dependency injection"""
 
     def __init__(self, database: AgnosticDatabase):
+        self.database = database
         self.collection = database.netlists
 
+    async def ensure_indexes(self) -> None:
+        """Create the indexes used by submission lookups and listings"""
+        await self.collection.create_index([("id", 1), ("user_id", 1)])
+        await self.collection.create_index(_RECENT_FIRST)
+        await self.collection.create_index([("user_id", 1), *_RECENT_FIRST])
+
     async def create(self, submission: NetlistSubmission) -> str:
         """Create a new netlist submission"""
-        doc = submission.model_dump(mode="json")
+        doc = _submission_doc(submission)
         result = await self.collection.insert_one(doc)
+        _forget_counts([doc])
         return str(result.inserted_id)
 
+    def create_deferred(self, submission: NetlistSubmission) -> None:
+        """Queue a netlist submission for a batched insert
+
+        Returns immediately; the submission is written within
+        _OUTBOX_FLUSH_DELAY seconds, or by flush_deferred_inserts() at
+        shutdown. Write errors are logged rather than reported to the caller,
+        so use create() when the caller needs the write confirmed.
+        """
+        global _flush_task
+        _outbox.append((self.collection, _submission_doc(submission)))
+        if _flush_task is None:
+            _flush_task = asyncio.create_task(_flush_later())
+
     async def get_by_id(self, submission_id: str) -> NetlistSubmission | None:
         """Get netlist by submission ID"""
         doc = await self.collection.find_one({"id": submission_id})
@@ -28,50 +143,156 @@ class NetlistRepository:
             doc = NetlistSubmission(**doc)
         return doc
 
+    async def get_by_id_for_user(
+        self, submission_id: str, user_id: str | None = None
+    ) -> NetlistSubmission | None:
+        """Get a netlist by submission ID, only if it belongs to `user_id`
+
+        With `user_id=None` (admins) any submission matches. Ownership is part
+        of the query, so a submission the user may not see is never fetched.
+        """
+        query = {"id": submission_id}
+        if user_id is not None:
+            query["user_id"] = user_id
+        doc = await self.collection.find_one(query)
+        if doc is not None:
+            doc = NetlistSubmission(**doc)
+        return doc
+
+    async def exists(self, submission_id: str) -> bool:
+        """Check whether a submission exists, whoever it belongs to"""
+        doc = await self.collection.find_one({"id": submission_id}, {"_id": 1})
+        return doc is not None
+
+    async def _find_recent(
+        self,
+        query: dict,
+        limit: int,
+        projection: dict | None = None,
+        skip: int = 0,
+    ) -> list[dict]:
+        """Find documents matching `query`, ordered by most recent first"""
+        cursor = self.collection.find(query, projection).sort(_RECENT_FIRST)
+        if skip:
+            cursor = cursor.skip(skip)
+        return await cursor.limit(limit).to_list(length=limit)
+
     async def list_by_user(
         self, user_id: str, limit: int = 10
     ) -> list[NetlistSubmission]:
         """List netlists for a user, ordered by most recent first"""
-        cursor = (
-            self.collection.find({"user_id": user_id})
-            .sort("submission_timestamp", -1)
-            .limit(limit)
-        )
-        docs = await cursor.to_list(length=limit)
+        docs = await self._find_recent({"user_id": user_id}, limit)
         return [NetlistSubmission(**doc) for doc in docs]
 
     async def list_all(self, limit: int = 10) -> list[NetlistSubmission]:
         """List all netlists, ordered by most recent first"""
-        cursor = self.collection.find({}).sort("submission_timestamp", -1).limit(limit)
-        docs = await cursor.to_list(length=limit)
+        docs = await self._find_recent({}, limit)
         return [NetlistSubmission(**doc) for doc in docs]
 
     async def list(
-        self, user_id: UUID4 | None = None, pagination: PaginationParams | None = None
-    ):
+        self,
+        user_id: str | None = None,
+        pagination: PaginationParams | None = None,
+        after: NetlistListCursor | None = None,
+    ) -> tuple[list[NetlistSubmissionSummary], int, NetlistListCursor | None]:
+        """List submission summaries (optionally for one user)
+
+        Pages start right after the `after` cursor when one is given, which
+        costs the same at any depth; otherwise `pagination.page` is honored by
+        skipping, which is only cheap for the first few pages.
+
+        Only the summary fields are fetched; use get_by_id for a full submission.
+
+        Returns:
+            The summaries, the total number of matching submissions, and the
+            cursor for the next page (None when this page is the last)
+        """
+        limit = pagination.page_size if pagination else 10
+        skip = 0
         if user_id:
-            # Filter by user_id
-            submissions = await self.list_by_user(user_id, pagination.page_size)
+            # Filter by user_id (stored as a string, see create)
+            query = {"user_id": user_id}
             total_count = await self.count_by_user(user_id)
-        elif pagination:
-            # Get all submissions
-            submissions = await self.list_all(pagination.page_size)
-            total_count = await self.count()
         else:
-            submissions = await self.list_all()
+            # Get all submissions
+            query = {}
             total_count = await self.count()
 
-        return submissions, total_count
+        if after is not None:
+            # Compare in the form documents are stored in (see create)
+            timestamp = _stored_timestamp(after.submission_timestamp)
+            query["$or"] = [
+                {"submission_timestamp": {"$lt": timestamp}},
+                {"submission_timestamp": timestamp, "id": {"$lt": str(after.id)}},
+            ]
+        elif pagination:
+            skip = (pagination.page - 1) * pagination.page_size
+
+        docs = await self._find_recent(query, limit, _SUMMARY_PROJECTION, skip)
+        submissions = [NetlistSubmissionSummary(**doc) for doc in docs]
+        next_cursor = None
+        if len(submissions) == limit:
+            last = submissions[-1]
+            next_cursor = NetlistListCursor(
+                submission_timestamp=last.submission_timestamp, id=last.id
+            )
+        return submissions, total_count, next_cursor
+
+    async def iter_summaries(
+        self, user_id: str | None = None
+    ) -> AsyncIterator[NetlistSubmissionSummary]:
+        """Yield every submission summary (optionally for one user), newest first
+
+        Documents are fetched in batches as the caller consumes them, so the
+        listing is never held in memory as a whole.
+        """
+        query = {} if user_id is None else {"user_id": user_id}
+        cursor = (
+            self.collection.find(query, _SUMMARY_PROJECTION)
+            .sort(_RECENT_FIRST)
+            .batch_size(_STREAM_BATCH_SIZE)
+        )
+        async for doc in cursor:
+            yield NetlistSubmissionSummary(**doc)
 
     async def count(self) -> int:
-        """Count total netlists"""
-        return await self.collection.count_documents({})
+        """Count total netlists (from collection metadata, without a scan)"""
+        total = _count_cache.get(None)
+        if total is None:
+            total = _count_cache[None] = (
+                await self.collection.estimated_document_count()
+            )
+        return total
 
     async def count_by_user(self, user_id: str) -> int:
         """Count netlists for a specific user"""
-        return await self.collection.count_documents({"user_id": user_id})
+        total = _count_cache.get(user_id)
+        if total is None:
+            total = _count_cache[user_id] = await self.collection.count_documents(
+                {"user_id": user_id}
+            )
+        return total
+
+
+# Repositories only hold their database handles (deferred inserts wait in the
+# module-level outbox), so keep one per database object.
+# Keyed by id() because Motor database objects are not reliably hashable.
+_repo_cache: dict[int, NetlistRepository] = {}
 
 
 def get_netlist_repository(database: AgnosticDatabase) -> NetlistRepository:
-    """Factory function to create repository with database dependency"""
-    return NetlistRepository(database)
+    """Factory function returning the netlist repository for a database"""
+    repo = _repo_cache.get(id(database))
+    # The identity check guards against id() reuse after a reconnect
+    if repo is None or repo.database is not database:
+        repo = _repo_cache[id(database)] = NetlistRepository(database)
+    return repo
+
+
+async def flush_deferred_inserts() -> None:
+    """Write every insert queued by create_deferred (call before disconnecting)"""
+    if _flush_task is not None:
+        # the pending task writes whatever is queued, including anything
+        # added while it runs
+        await _flush_task
+    await _write_outbox()
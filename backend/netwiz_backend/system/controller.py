@@ -11,7 +11,7 @@ from netwiz_backend.auth.decorators import ADMIN, PUBLIC
 from netwiz_backend.auth.jwt_utils import create_access_token, verify_password
 from netwiz_backend.auth.middleware import get_current_active_user
 from netwiz_backend.auth.repository import get_auth_repository
-from netwiz_backend.config import settings
+from netwiz_backend.config import get_settings
 from netwiz_backend.controller_abc import RouteControllerABC
 from netwiz_backend.database import get_database
 from netwiz_backend.git_metadata import get_git_metadata
@@ -90,6 +90,8 @@ class SystemController(RouteControllerABC):
         Provides basic health status information for the API service.
         Used by monitoring systems and load balancers to verify service availability.
         """
+        settings = get_settings()
+
         # Check MongoDB connectivity
         mongodb_status = "unknown"
         overall_status = "healthy"
@@ -121,6 +123,7 @@ class SystemController(RouteControllerABC):
         Provides essential metadata about the API service including name, version,
         author, and links to documentation and health check endpoints.
         """
+        settings = get_settings()
         git_metadata = get_git_metadata()
 
         return RootResponse(
@@ -145,6 +148,7 @@ class SystemController(RouteControllerABC):
         Provides comprehensive information about the API service including detailed
         metadata, service configuration, and available endpoints for API discovery.
         """
+        settings = get_settings()
         return ApiInfoResponse(
             api=ApiInfo(
                 name=settings.app_name,
@@ -180,7 +184,9 @@ class SystemController(RouteControllerABC):
         auth_repo = get_auth_repository(database)
         user = await auth_repo.get_user_by_username(form_data.username)
 
-        if not user or not verify_password(form_data.password, user.hashed_password):
+        if not user or not await verify_password(
+            form_data.password, user.hashed_password
+        ):
             raise HTTPException(
                 status_code=401,
                 detail="Incorrect username or password",
@@ -200,6 +206,7 @@ class SystemController(RouteControllerABC):
         Initiates a graceful shutdown of the API server. Only available in development
         mode for safety reasons. Returns 403 Forbidden in production environments.
         """
+        settings = get_settings()
         if settings.environment != "development":
             raise HTTPException(
                 status_code=403,
@@ -24,15 +24,13 @@ class GitMetadata(BaseModel):
 class HealthResponse(BaseModel):
     """Health check response model"""
 
-    status: constr(strip_whitespace=True) = Field(..., description="Service status")
+    model_config = {"defer_build": True}
+
+    status: str = Field(..., description="Service status")
     timestamp: datetime = Field(..., description="Current timestamp")
-    version: constr(strip_whitespace=True) = Field(..., description="API version")
-    environment: constr(strip_whitespace=True) = Field(
-        ..., description="Environment (development/production)"
-    )
-    mongodb: constr(strip_whitespace=True) | None = Field(
-        None, description="MongoDB connection status"
-    )
+    version: str = Field(..., description="API version")
+    environment: str = Field(..., description="Environment (development/production)")
+    mongodb: str | None = Field(None, description="MongoDB connection status")
 
 
 class RootResponse(BaseModel):
@@ -2,8 +2,150 @@
 Backend test configuration and fixtures
 """
 
+import os
+
 import pytest
 
+# Settings are read at import time by several modules; unit tests never
+# connect, so any well-formed values do
+os.environ.setdefault("MONGODB_URI", "mongodb://localhost:27017")
+os.environ.setdefault("MONGODB_DATABASE", "netwiz_test")
+
+
+def _matches(doc: dict, query: dict) -> bool:
+    """Evaluate the subset of Mongo queries the repositories use"""
+    for key, expected in query.items():
+        if key == "$or":
+            if not any(_matches(doc, sub) for sub in expected):
+                return False
+        elif isinstance(expected, dict):
+            if key not in doc or not doc[key] < expected["$lt"]:
+                return False
+        elif doc.get(key) != expected:
+            return False
+    return True
+
+
+class StubCursor:
+    """Just enough of a Motor cursor for sorted, paged and streamed listings"""
+
+    def __init__(self, docs: list[dict]):
+        self.docs = docs
+
+    def sort(self, keys):
+        # stable sorts, least significant key first
+        for key, direction in reversed(keys):
+            self.docs.sort(key=lambda d: d[key], reverse=direction < 0)
+        return self
+
+    def skip(self, n):
+        self.docs = self.docs[n:]
+        return self
+
+    def limit(self, n):
+        self.docs = self.docs[:n]
+        return self
+
+    def batch_size(self, n):
+        return self
+
+    async def to_list(self, length):
+        return self.docs[:length]
+
+    async def __aiter__(self):
+        for doc in self.docs:
+            yield doc
+
+
+class StubCollection:
+    """
+    In-memory stand-in for a Motor collection
+
+    `unique` lists the fields with a unique index: inserting a duplicate
+    raises DuplicateKeyError like Mongo does. Setting `write_error` makes
+    every insert raise it instead.
+    """
+
+    def __init__(self, docs=(), unique: tuple[str, ...] = ("id",)):
+        self.docs = [dict(d) for d in docs]
+        self.unique = unique
+        self.write_error: Exception | None = None
+        self.find_one_calls = 0
+
+    def _check_insert(self, doc: dict) -> None:
+        if self.write_error is not None:
+            raise self.write_error
+        if any(d.get(f) == doc.get(f) for f in self.unique for d in self.docs):
+            # imported here so suites without Mongo code (json_tracker) do
+            # not need the driver installed
+            from pymongo.errors import DuplicateKeyError
+
+            raise DuplicateKeyError("E11000 duplicate key error")
+
+    async def find_one(self, query, projection=None):
+        self.find_one_calls += 1
+        for doc in self.docs:
+            if _matches(doc, query):
+                return dict(doc)
+        return None
+
+    def find(self, query, projection=None):
+        found = [dict(d) for d in self.docs if _matches(d, query)]
+        for field, include in (projection or {}).items():
+            if not include:
+                for doc in found:
+                    doc.pop(field, None)
+        return StubCursor(found)
+
+    async def insert_one(self, doc):
+        self._check_insert(doc)
+        self.docs.append(dict(doc))
+
+        class Result:
+            inserted_id = len(self.docs)
+
+        return Result()
+
+    async def insert_many(self, docs, ordered=True):
+        for doc in docs:
+            await self.insert_one(doc)
+
+    async def update_one(self, query, update):
+        matched = [d for d in self.docs if _matches(d, query)]
+        for doc in matched:
+            doc.update(update["$set"])
+
+        class Result:
+            modified_count = len(matched)
+
+        return Result()
+
+    async def count_documents(self, query):
+        return sum(_matches(d, query) for d in self.docs)
+
+    async def estimated_document_count(self):
+        return len(self.docs)
+
+
+class StubDatabase:
+    """In-memory stand-in for a Motor database, holding StubCollections"""
+
+    def __init__(self, **collections: StubCollection):
+        for name, collection in collections.items():
+            setattr(self, name, collection)
+
+
+@pytest.fixture
+def stub_collection():
+    """Factory for in-memory collections: stub_collection(docs, unique=...)"""
+    return StubCollection
+
+
+@pytest.fixture
+def stub_database():
+    """Factory for in-memory databases: stub_database(users=collection, ...)"""
+    return StubDatabase
+
 
 @pytest.fixture
 def sample_netlist():
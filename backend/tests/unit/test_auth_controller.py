@@ -0,0 +1,43 @@
+"""
+Tests for auth controller handlers, called directly with a stubbed database
+"""
+
+import asyncio
+
+import pytest
+from fastapi import HTTPException, status
+
+from netwiz_backend.auth import controller as auth_controller
+from netwiz_backend.auth.controller import AuthController
+from netwiz_backend.auth.models import UserCreate
+
+
+@pytest.fixture
+def fast_hashing(monkeypatch):
+    async def fake_hash(password: str) -> str:
+        return f"hashed:{password}"
+
+    monkeypatch.setattr(auth_controller, "get_password_hash", fake_hash)
+
+
+class TestSignup:
+    def test_taken_username_is_a_400(
+        self, fast_hashing, stub_collection, stub_database
+    ):
+        controller = AuthController(prefix="/auth")
+        # the unique index on username is what rejects the signup
+        users = stub_collection(
+            [{"id": "user-1", "username": "alice"}], unique=("username", "id")
+        )
+        database = stub_database(users=users)
+
+        with pytest.raises(HTTPException) as exc_info:
+            asyncio.run(
+                controller.signup(
+                    UserCreate(username="alice", password="secret123"),
+                    database=database,
+                )
+            )
+
+        assert exc_info.value.status_code == status.HTTP_400_BAD_REQUEST
+        assert exc_info.value.detail == "Username already registered"
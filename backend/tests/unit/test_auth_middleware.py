@@ -0,0 +1,99 @@
+"""
+Tests for the decorator-based auth middleware, called directly on a small app
+"""
+
+import asyncio
+
+import pytest
+from fastapi import FastAPI, Request, status
+
+from netwiz_backend.auth import middleware_auth
+from netwiz_backend.auth.decorators import AUTH, PUBLIC
+from netwiz_backend.auth.middleware_auth import auth_middleware
+from netwiz_backend.auth.models import TokenData
+
+PASSED = object()
+
+
+@PUBLIC
+async def public_endpoint():
+    return {}
+
+
+@AUTH
+async def protected_endpoint():
+    return {}
+
+
+@pytest.fixture
+def app() -> FastAPI:
+    app = FastAPI()
+    app.add_api_route("/public", public_endpoint, methods=["GET"])
+    app.add_api_route("/protected/{item_id}", protected_endpoint, methods=["GET"])
+    return app
+
+
+@pytest.fixture
+def decoded_tokens(monkeypatch) -> list[str]:
+    decoded = []
+
+    def fake_verify_token(token: str) -> TokenData | None:
+        decoded.append(token)
+        if token != "good":
+            return None
+        return TokenData(username="alice", user_id="user-1")
+
+    monkeypatch.setattr(middleware_auth, "verify_token", fake_verify_token)
+    return decoded
+
+
+def dispatch(app: FastAPI, path: str, token: str | None = None):
+    headers = [] if token is None else [(b"authorization", f"Bearer {token}".encode())]
+    request = Request(
+        {
+            "type": "http",
+            "app": app,
+            "method": "GET",
+            "path": path,
+            "root_path": "",
+            "query_string": b"",
+            "headers": headers,
+        }
+    )
+
+    async def call_next(request):
+        return PASSED
+
+    return request, asyncio.run(auth_middleware(request, call_next))
+
+
+class TestAuthMiddleware:
+    def test_public_route_never_decodes_the_token(self, app, decoded_tokens):
+        _, response = dispatch(app, "/public", token="good")
+
+        assert response is PASSED
+        assert decoded_tokens == []
+
+    def test_protected_route_without_token_is_a_401(self, app, decoded_tokens):
+        _, response = dispatch(app, "/protected/1")
+
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_protected_route_with_bad_token_is_a_401(self, app, decoded_tokens):
+        _, response = dispatch(app, "/protected/1", token="bad")
+
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+        assert decoded_tokens == ["bad"]
+
+    def test_protected_route_stores_the_decoded_token(self, app, decoded_tokens):
+        request, response = dispatch(app, "/protected/1", token="good")
+
+        assert response is PASSED
+        assert request.state.token_data.username == "alice"
+        assert decoded_tokens == ["good"]
+
+    def test_unknown_path_is_left_to_the_router(self, app, decoded_tokens):
+        _, response = dispatch(app, "/missing", token="good")
+
+        assert response is PASSED
+        assert decoded_tokens == []
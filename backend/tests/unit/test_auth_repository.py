@@ -0,0 +1,117 @@
+"""
+Tests for the auth repository, with a stubbed Mongo collection
+"""
+
+import asyncio
+from datetime import datetime, timezone
+
+import pytest
+
+from netwiz_backend.auth import repository
+from netwiz_backend.auth.models import User
+from netwiz_backend.auth.repository import AuthRepository, DuplicateUserError
+
+
+def user_doc(**overrides):
+    doc = {
+        "id": "user-1",
+        "username": "alice",
+        "hashed_password": "old-hash",
+        "user_type": "user",
+        "created_at": datetime(2024, 1, 1, tzinfo=timezone.utc),
+        "is_active": True,
+    }
+    doc.update(overrides)
+    return doc
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    repository._user_cache.clear()
+    repository._cached_usernames.clear()
+    repository._exists_cache.clear()
+    yield
+    repository._user_cache.clear()
+    repository._cached_usernames.clear()
+    repository._exists_cache.clear()
+
+
+@pytest.fixture
+def make_repo(stub_collection, stub_database):
+    def make(*docs):
+        collection = stub_collection(docs, unique=("username", "id"))
+        return AuthRepository(stub_database(users=collection)), collection
+
+    return make
+
+
+class TestUserCache:
+    """Cached lookups are opt-in, short-lived and never shared"""
+
+    def test_uncached_lookup_always_reads_the_collection(self, make_repo):
+        repo, collection = make_repo(user_doc())
+
+        async def run():
+            await repo.get_user_by_username("alice", use_cache=True)
+            collection.docs[0]["hashed_password"] = "new-hash"
+            return await repo.get_user_by_username("alice")
+
+        user = asyncio.run(run())
+        assert user.hashed_password == "new-hash"
+        assert collection.find_one_calls == 2
+
+    def test_cached_lookup_skips_the_collection(self, make_repo):
+        repo, collection = make_repo(user_doc())
+
+        async def run():
+            await repo.get_user_by_username("alice", use_cache=True)
+            return await repo.get_user_by_username("alice", use_cache=True)
+
+        user = asyncio.run(run())
+        assert user.username == "alice"
+        assert collection.find_one_calls == 1
+
+    def test_cached_users_are_copies(self, make_repo):
+        repo, _ = make_repo(user_doc())
+
+        async def run():
+            first = await repo.get_user_by_username("alice", use_cache=True)
+            first.is_active = False
+            return first, await repo.get_user_by_username("alice", use_cache=True)
+
+        first, second = asyncio.run(run())
+        assert first is not second
+        assert second.is_active is True
+
+    def test_update_invalidates_cached_user(self, make_repo):
+        repo, collection = make_repo(user_doc())
+
+        async def run():
+            await repo.get_user_by_username("alice", use_cache=True)
+            await repo.update_user("user-1", {"is_active": False})
+            return await repo.get_user_by_username("alice", use_cache=True)
+
+        user = asyncio.run(run())
+        assert user.is_active is False
+        assert collection.find_one_calls == 2
+
+
+class TestCreateUser:
+    """Duplicate usernames are rejected by the unique index, not a pre-check"""
+
+    def test_duplicate_key_raises_duplicate_user_error(self, make_repo):
+        repo, collection = make_repo(user_doc())
+        user = User(username="alice", hashed_password="hash")
+
+        with pytest.raises(DuplicateUserError):
+            asyncio.run(repo.create_user(user))
+        assert len(collection.docs) == 1
+        assert collection.find_one_calls == 0
+
+    def test_new_user_is_inserted_and_marked_taken(self, make_repo):
+        repo, collection = make_repo(user_doc())
+        user = User(username="bob", hashed_password="hash")
+
+        asyncio.run(repo.create_user(user))
+        assert [d["username"] for d in collection.docs] == ["alice", "bob"]
+        assert repository._exists_cache["bob"] is True
@@ -0,0 +1,101 @@
+"""
+Tests for git metadata detection, with the git commands stubbed out
+"""
+
+from pathlib import Path
+
+import pytest
+
+from netwiz_backend import git_metadata
+
+FULL_HASH = "0123456789abcdef0123456789abcdef01234567"
+
+
+@pytest.fixture
+def git(monkeypatch):
+    """Answer git commands from a {subcommand: output} dict, recording calls"""
+    outputs: dict[str, str | None] = {}
+    calls: list[list[str]] = []
+
+    def fake_run(command: list[str], cwd: Path) -> str | None:
+        calls.append(command)
+        subcommand = next(part for part in command[1:] if part in ("log", "rev-parse"))
+        return outputs.get(subcommand)
+
+    monkeypatch.setattr(git_metadata, "_find_git_root", lambda: Path("/repo"))
+    monkeypatch.setattr(git_metadata, "_run_git_command", fake_run)
+    git_metadata._detect_git_metadata.cache_clear()
+    yield outputs, calls
+    git_metadata._detect_git_metadata.cache_clear()
+
+
+def log_output(refnames: str) -> str:
+    return f"{FULL_HASH}\x000123456\x00{refnames}"
+
+
+class TestDetectGitMetadata:
+    def test_branch_and_tag_come_from_one_log_call(self, git):
+        outputs, calls = git
+        outputs["log"] = log_output("HEAD -> main, tag: v1.0, origin/main")
+
+        metadata = git_metadata._detect_git_metadata()
+        assert metadata.commit_hash == FULL_HASH
+        assert metadata.commit_short == "0123456"
+        assert metadata.branch == "main"
+        assert metadata.tag == "v1.0"
+        assert metadata.build_ref == "refs/heads/main"
+        assert metadata.build_sha == FULL_HASH
+        assert len(calls) == 1
+
+    def test_first_tag_wins(self, git):
+        outputs, _ = git
+        outputs["log"] = log_output("HEAD -> main, tag: v2.0, tag: v1.9")
+
+        assert git_metadata._detect_git_metadata().tag == "v2.0"
+
+    def test_branch_names_with_slashes_are_kept_whole(self, git):
+        outputs, _ = git
+        outputs["log"] = log_output("HEAD -> feature/cursor-paging")
+
+        assert git_metadata._detect_git_metadata().branch == "feature/cursor-paging"
+
+    def test_detached_head(self, git):
+        outputs, calls = git
+        outputs["log"] = log_output("HEAD, tag: v1.0")
+
+        metadata = git_metadata._detect_git_metadata()
+        # same as `git rev-parse --abbrev-ref HEAD` on a detached HEAD
+        assert metadata.branch == "HEAD"
+        assert metadata.tag == "v1.0"
+        assert len(calls) == 1
+
+    def test_untagged_commit_has_no_tag(self, git):
+        outputs, _ = git
+        outputs["log"] = log_output("HEAD -> main")
+
+        assert git_metadata._detect_git_metadata().tag is None
+
+    def test_missing_head_ref_falls_back_to_rev_parse(self, git):
+        outputs, calls = git
+        outputs["log"] = log_output("")
+        outputs["rev-parse"] = "main"
+
+        assert git_metadata._detect_git_metadata().branch == "main"
+        assert calls[-1][:2] == ["git", "rev-parse"]
+
+    def test_no_repository(self, git, monkeypatch):
+        _, calls = git
+        monkeypatch.setattr(git_metadata, "_find_git_root", lambda: None)
+
+        assert git_metadata._detect_git_metadata() is None
+        assert calls == []
+
+    def test_failed_git_command(self, git):
+        # outputs left empty: every git command "fails" and returns None
+        assert git_metadata._detect_git_metadata() is None
+
+    def test_unexpected_log_output(self, git):
+        outputs, _ = git
+        outputs["log"] = "not the requested format"
+
+        assert git_metadata._detect_git_metadata() is None
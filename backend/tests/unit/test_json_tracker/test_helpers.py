@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import pytest
+
+from collections import OrderedDict
+from enum import IntEnum
+
+from netwiz_backend.json_tracker import TrackedJson, create_location_mapping
+from netwiz_backend.json_tracker.helpers import (
+    _escape_pointer_token,
+    _infer_kind,
+    _unescape_pointer_token,
+)
+
+# ── JSON Pointer token codec (RFC 6901) ─────────────────────────────────────────
+
+
+@pytest.mark.parametrize(
+    ("token", "expected"),
+    [
+        ("plain", "plain"),
+        ("", ""),
+        ("a~1b", "a/b"),
+        ("m~0n", "m~n"),
+        # "~01" is an escaped "~" followed by "1", never "/"
+        ("~01", "~1"),
+        # "~10" is an escaped "/" followed by "0"
+        ("~10", "/0"),
+        ("~0~1", "~/"),
+        ("~1~0", "/~"),
+    ],
+)
+def test_unescape_pointer_token(token: str, expected: str):
+    assert _unescape_pointer_token(token) == expected
+
+
+@pytest.mark.parametrize(
+    ("key", "expected"),
+    [
+        ("plain", "plain"),
+        ("a/b", "a~1b"),
+        ("m~n", "m~0n"),
+        ("~1", "~01"),
+        ("/0", "~10"),
+    ],
+)
+def test_escape_pointer_token(key: str, expected: str):
+    assert _escape_pointer_token(key) == expected
+
+
+@pytest.mark.parametrize(
+    "key", ["", "plain", "a/b", "m~n", "~", "/", "~0", "~1", "~01", "/~/", "~~//"]
+)
+def test_escape_unescape_round_trip(key: str):
+    assert _unescape_pointer_token(_escape_pointer_token(key)) == key
+
+
+def test_pointer_paths_resolve_escaped_keys():
+    tj = TrackedJson.loads('{"a/b": 1, "m~n": 2, "~1": 3}')
+
+    assert tj["/a~1b"].to_value() == 1
+    assert tj["/m~0n"].to_value() == 2
+    assert tj["/~01"].to_value() == 3
+
+
+# ── Kind inference ──────────────────────────────────────────────────────────────
+
+
+class _Level(IntEnum):
+    LOW = 1
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        # bool subclasses int but must never be reported as a number
+        (True, "boolean"),
+        (False, "boolean"),
+        (0, "number"),
+        (1, "number"),
+        (1.5, "number"),
+        (None, "null"),
+        ("true", "string"),
+        ({}, "object"),
+        ([], "list"),
+        # subclasses fall back to isinstance checks
+        (OrderedDict(), "object"),
+        (_Level.LOW, "number"),
+    ],
+)
+def test_infer_kind(value, expected: str):
+    assert _infer_kind(value) == expected
+
+
+def test_boolean_values_get_the_boolean_kind():
+    locations = create_location_mapping('{"on": true, "off": false, "n": 1}')
+
+    assert locations["$.on"].kind == "boolean"
+    assert locations["$.off"].kind == "boolean"
+    assert locations["$.n"].kind == "number"
@@ -548,3 +548,53 @@ def test_complex_navigation_scenario():
     assert "users" in tj
     assert "$.users.0.profile.name" in tj
     assert "/users/0/profile/settings/theme" in tj
+
+
+def test_to_value_returns_independent_copies():
+    tj = TrackedJson.loads('{"a": {"b": [1, 2]}}')
+
+    # mutating a child's value leaves the parent's value alone
+    tj["a"].to_value()["b"].append(99)
+    assert tj.to_value() == {"a": {"b": [1, 2]}}
+
+    # ...and repeated calls on one node never hand out the same object
+    first = tj["a"].to_value()
+    first["b"].clear()
+    assert tj["a"].to_value() == {"b": [1, 2]}
+    assert tj["a"].to_value() is not tj["a"].to_value()
+    assert tj["a"]["b"].data == [1, 2]
+
+
+def test_integers_wider_than_64_bits_stay_exact():
+    big = 2**70 + 1
+    tj = TrackedJson.loads(f'{{"id": {big}, "neg": -{big}, "items": [{big}]}}')
+
+    assert tj.error is None
+    assert tj["id"].data == big
+    assert tj["neg"].data == -big
+    assert tj["id"].location.kind == "number"
+    # the copy handed out by to_value keeps them exact too
+    assert tj.to_value() == {"id": big, "neg": -big, "items": [big]}
+
+
+def test_non_json_constants_are_rejected_next_to_wide_integers():
+    tj = TrackedJson.loads(f'{{"id": {2**70}, "x": NaN}}')
+
+    assert isinstance(tj.error, TrackedJSONDecodeError)
+
+
+def test_location_mappings_are_only_shared_on_request():
+    text = '{"shared": [1, 2]}'
+
+    # by default every load builds its own mapping
+    assert TrackedJson.loads(text).locations is not TrackedJson.loads(text).locations
+
+    cached = TrackedJson.loads(text, use_cache=True)
+    again = TrackedJson.loads(text, use_cache=True)
+    assert again.locations is cached.locations
+    # the reused mapping still comes with a freshly parsed value
+    again["shared"].data.append(3)
+    assert cached["shared"].data == [1, 2]
+
+    # parse errors are never cached
+    assert TrackedJson.loads("{", use_cache=True).error is not None
@@ -0,0 +1,105 @@
+"""
+Tests for JWT and password utilities
+"""
+
+import hashlib
+import time
+from datetime import timedelta
+
+import bcrypt
+import pytest
+
+from netwiz_backend.auth import jwt_utils
+from netwiz_backend.auth.jwt_utils import (
+    _get_password_hash_sync,
+    _verify_password_sync,
+    create_access_token,
+    create_refresh_token,
+    password_needs_rehash,
+    verify_refresh_token,
+    verify_token,
+)
+from netwiz_backend.auth.models import TokenData
+from netwiz_backend.config import get_settings
+
+CLAIMS = {"sub": "alice", "user_id": "user-1"}
+
+
+@pytest.fixture(autouse=True)
+def clear_token_caches():
+    jwt_utils._access_cache.clear()
+    jwt_utils._refresh_cache.clear()
+    yield
+    jwt_utils._access_cache.clear()
+    jwt_utils._refresh_cache.clear()
+
+
+def cache_key(token: str) -> bytes:
+    return hashlib.sha256(token.encode("utf-8")).digest()
+
+
+class TestTokenCache:
+    """Verified tokens are cached, but never past their exp claim"""
+
+    def test_valid_token_is_verified_once(self, monkeypatch):
+        token = create_access_token(CLAIMS)
+        first = verify_token(token)
+        assert first.username == "alice"
+        assert first.user_id == "user-1"
+
+        def fail(*args, **kwargs):
+            raise AssertionError("cached token decoded again")
+
+        monkeypatch.setattr(jwt_utils.jwt, "decode", fail)
+        assert verify_token(token) is first
+
+    def test_cached_entry_does_not_outlive_exp(self):
+        token = create_access_token(CLAIMS, expires_delta=timedelta(seconds=-1))
+        # As if cached while still valid: the entry's exp has passed since
+        jwt_utils._access_cache[cache_key(token)] = (
+            TokenData.model_construct(username="alice", user_id="user-1"),
+            time.time() - 1,
+        )
+
+        assert verify_token(token) is None
+        assert cache_key(token) not in jwt_utils._access_cache
+
+    def test_expired_token_is_not_cached(self):
+        token = create_access_token(CLAIMS, expires_delta=timedelta(seconds=-1))
+        assert verify_token(token) is None
+        assert cache_key(token) not in jwt_utils._access_cache
+
+    def test_token_types_are_not_interchangeable(self):
+        refresh = create_refresh_token(CLAIMS)
+        assert verify_token(refresh) is None
+        assert verify_refresh_token(refresh).username == "alice"
+        assert verify_refresh_token(create_access_token(CLAIMS)) is None
+
+
+def legacy_bcrypt_hash(password: str) -> str:
+    """A hash as stored before the switch to Argon2 (peppered bcrypt)"""
+    peppered = (get_settings().password_pepper + password).encode("utf-8")
+    return bcrypt.hashpw(peppered, bcrypt.gensalt(rounds=4)).decode("utf-8")
+
+
+class TestPasswordHashing:
+    """Argon2id for new hashes; legacy bcrypt hashes verify until re-hashed"""
+
+    def test_argon2_hash_round_trip(self):
+        hashed = _get_password_hash_sync("secret123")
+        assert hashed.startswith("$argon2id$")
+        assert _verify_password_sync("secret123", hashed)
+        assert not _verify_password_sync("wrong", hashed)
+        assert not password_needs_rehash(hashed)
+
+    def test_legacy_bcrypt_hash_still_verifies(self):
+        hashed = legacy_bcrypt_hash("secret123")
+        assert _verify_password_sync("secret123", hashed)
+        assert not _verify_password_sync("wrong", hashed)
+
+    def test_legacy_bcrypt_hash_needs_rehash(self):
+        assert password_needs_rehash(legacy_bcrypt_hash("secret123"))
+
+    def test_unrecognized_hash_is_rejected_and_needs_rehash(self):
+        assert not _verify_password_sync("secret123", "not-a-hash")
+        assert password_needs_rehash("not-a-hash")
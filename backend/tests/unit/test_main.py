@@ -0,0 +1,55 @@
+"""
+Tests for the application lifecycle hooks, with a stubbed database
+"""
+
+import asyncio
+import uuid
+
+import pytest
+
+from netwiz_backend import main
+from netwiz_backend.netlist import repository
+from netwiz_backend.netlist.models import NetlistSubmission
+from netwiz_backend.netlist.repository import NetlistRepository
+
+
+class TestShutdown:
+    def test_queued_inserts_are_written_before_the_database_closes(
+        self, stub_collection, stub_database, monkeypatch
+    ):
+        collection = stub_collection()
+        repo = NetlistRepository(stub_database(netlists=collection))
+        written_at_close = []
+
+        async def fake_close_database() -> None:
+            written_at_close.append(len(collection.docs))
+
+        monkeypatch.setattr(main, "close_database", fake_close_database)
+
+        async def run():
+            repo.create_deferred(
+                NetlistSubmission(
+                    id=uuid.uuid4(), json_text="{}", netlist=None, user_id=None
+                )
+            )
+            await main.NetwizApp.on_shutdown()
+
+        asyncio.run(run())
+        assert written_at_close == [1]
+        assert repository._outbox == []
+
+    def test_the_database_closes_even_when_the_flush_fails(self, monkeypatch):
+        closed = []
+
+        async def failing_flush() -> None:
+            raise RuntimeError("flush failed")
+
+        async def fake_close_database() -> None:
+            closed.append(True)
+
+        monkeypatch.setattr(repository, "flush_deferred_inserts", failing_flush)
+        monkeypatch.setattr(main, "close_database", fake_close_database)
+
+        with pytest.raises(RuntimeError, match="flush failed"):
+            asyncio.run(main.NetwizApp.on_shutdown())
+        assert closed == [True]
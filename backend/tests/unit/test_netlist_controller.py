@@ -0,0 +1,240 @@
+"""
+Tests for netlist controller handlers, called directly with a stubbed database
+"""
+
+import asyncio
+import io
+import json
+import uuid
+from datetime import datetime, timezone
+
+import pytest
+from fastapi import HTTPException, UploadFile, status
+
+from netwiz_backend.auth.models import User, UserType
+from netwiz_backend.models import PaginationParams
+from netwiz_backend.netlist import repository
+from netwiz_backend.netlist.controller import NetlistController
+from netwiz_backend.netlist.repository import NetlistRepository
+
+OWNER = User(id=str(uuid.uuid4()), username="alice", hashed_password="hash")
+OTHER = User(id=str(uuid.uuid4()), username="bob", hashed_password="hash")
+ADMIN = User(
+    id=str(uuid.uuid4()),
+    username="carol",
+    hashed_password="hash",
+    user_type=UserType.ADMIN,
+)
+
+
+def submission_doc(owner: User, day: int = 1) -> dict:
+    return {
+        "id": str(uuid.uuid4()),
+        "json_text": "{}",
+        "netlist": None,
+        "user_id": owner.id,
+        "submission_timestamp": f"2024-01-{day:02d}T00:00:00.000000Z",
+        "filename": "board.json",
+    }
+
+
+def list_netlists(
+    repo: NetlistRepository,
+    page_size: int = 10,
+    after_timestamp: datetime | None = None,
+    after_id: uuid.UUID | None = None,
+) -> dict:
+    response = asyncio.run(
+        NetlistController(prefix="/netlist").list_netlists(
+            pagination=PaginationParams(page_size=page_size),
+            repo=repo,
+            current_user=OWNER,
+            user_id=None,
+            list_all=False,
+            after_timestamp=after_timestamp,
+            after_id=after_id,
+        )
+    )
+    return json.loads(response.body)
+
+
+def stream_netlists(
+    repo: NetlistRepository, current_user: User, list_all: bool = False
+) -> list[dict]:
+    async def run():
+        response = await NetlistController(prefix="/netlist").stream_netlists(
+            repo=repo, current_user=current_user, user_id=None, list_all=list_all
+        )
+        return [
+            json.loads(line)
+            async for chunk in response.body_iterator
+            for line in chunk.splitlines()
+        ]
+
+    return asyncio.run(run())
+
+
+@pytest.fixture(autouse=True)
+def clear_repository_state():
+    # counts are cached per process, and these tests reuse the same users
+    repository._count_cache.clear()
+    repository._outbox.clear()
+    yield
+    repository._count_cache.clear()
+    repository._outbox.clear()
+
+
+@pytest.fixture
+def make_repo(stub_collection, stub_database):
+    def make(*docs) -> NetlistRepository:
+        return NetlistRepository(stub_database(netlists=stub_collection(docs)))
+
+    return make
+
+
+@pytest.fixture
+def get_netlist(make_repo):
+    def get(doc: dict, submission_id: str, current_user: User):
+        return asyncio.run(
+            NetlistController(prefix="/netlist").get_netlist(
+                submission_id, repo=make_repo(doc), current_user=current_user
+            )
+        )
+
+    return get
+
+
+class TestGetNetlist:
+    def test_owner_gets_their_submission(self, get_netlist):
+        doc = submission_doc(OWNER)
+
+        response = get_netlist(doc, doc["id"], OWNER)
+        assert response.status_code == status.HTTP_200_OK
+        assert json.loads(response.body)["id"] == doc["id"]
+
+    def test_admin_gets_any_submission(self, get_netlist):
+        doc = submission_doc(OWNER)
+
+        response = get_netlist(doc, doc["id"], ADMIN)
+        assert json.loads(response.body)["id"] == doc["id"]
+
+    def test_someone_elses_submission_is_a_403(self, get_netlist):
+        doc = submission_doc(OWNER)
+
+        with pytest.raises(HTTPException) as exc_info:
+            get_netlist(doc, doc["id"], OTHER)
+        assert exc_info.value.status_code == status.HTTP_403_FORBIDDEN
+
+    def test_missing_submission_is_a_404(self, get_netlist):
+        doc = submission_doc(OWNER)
+
+        with pytest.raises(HTTPException) as exc_info:
+            get_netlist(doc, str(uuid.uuid4()), OWNER)
+        assert exc_info.value.status_code == status.HTTP_404_NOT_FOUND
+
+
+class TestListNetlists:
+    @pytest.mark.parametrize(
+        ("after_timestamp", "after_id"),
+        [
+            (datetime(2024, 1, 1, tzinfo=timezone.utc), None),
+            (None, uuid.uuid4()),
+        ],
+    )
+    def test_half_a_cursor_is_a_422(self, make_repo, after_timestamp, after_id):
+        with pytest.raises(HTTPException) as exc_info:
+            list_netlists(
+                make_repo(), after_timestamp=after_timestamp, after_id=after_id
+            )
+        assert exc_info.value.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+    def test_next_cursor_continues_after_the_last_listed_submission(self, make_repo):
+        docs = [submission_doc(OWNER, day) for day in (1, 2, 3)]
+        repo = make_repo(*docs)
+
+        first = list_netlists(repo, page_size=2)
+        cursor = first["next_cursor"]
+        second = list_netlists(
+            repo,
+            page_size=2,
+            after_timestamp=datetime.fromisoformat(cursor["submission_timestamp"]),
+            after_id=uuid.UUID(cursor["id"]),
+        )
+
+        assert [s["id"] for s in first["submissions"]] == [docs[2]["id"], docs[1]["id"]]
+        assert [s["id"] for s in second["submissions"]] == [docs[0]["id"]]
+        assert second["next_cursor"] is None
+        assert first["total_count"] == second["total_count"] == 3
+
+    def test_listings_leave_out_the_source_text(self, make_repo):
+        (listed,) = list_netlists(make_repo(submission_doc(OWNER)))["submissions"]
+
+        assert "json_text" not in listed
+        assert "netlist" not in listed
+
+
+class TestStreamNetlists:
+    def test_streams_the_users_summaries_then_the_count(self, make_repo):
+        docs = [
+            submission_doc(OWNER, 1),
+            submission_doc(OTHER, 2),
+            submission_doc(OWNER, 3),
+        ]
+
+        *summaries, total = stream_netlists(make_repo(*docs), OWNER)
+        assert [s["id"] for s in summaries] == [docs[2]["id"], docs[0]["id"]]
+        assert all("json_text" not in s for s in summaries)
+        assert total == {"total_count": 2}
+
+    def test_admin_streams_everyone_with_list_all(self, make_repo):
+        docs = [submission_doc(OWNER, 1), submission_doc(OTHER, 2)]
+
+        lines = stream_netlists(make_repo(*docs), ADMIN, list_all=True)
+        assert lines[-1] == {"total_count": 2}
+
+    def test_empty_stream_still_ends_with_the_count(self, make_repo):
+        assert stream_netlists(make_repo(), OWNER) == [{"total_count": 0}]
+
+    def test_list_all_is_admin_only(self, make_repo):
+        with pytest.raises(HTTPException) as exc_info:
+            stream_netlists(make_repo(), OWNER, list_all=True)
+        assert exc_info.value.status_code == status.HTTP_403_FORBIDDEN
+
+
+class TestUploadNetlist:
+    def upload(self, repo: NetlistRepository, content: bytes, durable: bool):
+        return NetlistController(prefix="/netlist").upload_netlist(
+            file=UploadFile(io.BytesIO(content), filename="board.json"),
+            durable=durable,
+            repo=repo,
+            current_user=OWNER,
+        )
+
+    def test_durable_upload_is_stored_before_the_201(self, make_repo, sample_netlist):
+        repo = make_repo()
+
+        response = asyncio.run(
+            self.upload(repo, json.dumps(sample_netlist).encode(), durable=True)
+        )
+        assert response.status_code == status.HTTP_201_CREATED
+        assert [d["id"] for d in repo.collection.docs] == [
+            json.loads(response.body)["id"]
+        ]
+
+    def test_deferred_upload_is_queued_behind_a_202(self, make_repo, sample_netlist):
+        repo = make_repo()
+
+        async def run():
+            response = await self.upload(
+                repo, json.dumps(sample_netlist).encode(), durable=False
+            )
+            stored_before_flush = len(repo.collection.docs)
+            await repository.flush_deferred_inserts()
+            return response, stored_before_flush
+
+        response, stored_before_flush = asyncio.run(run())
+        assert response.status_code == status.HTTP_202_ACCEPTED
+        assert stored_before_flush == 0
+        assert [d["id"] for d in repo.collection.docs] == [
+            json.loads(response.body)["id"]
+        ]
@@ -0,0 +1,204 @@
+"""
+Tests for the netlist repository, with a stubbed Mongo collection
+"""
+
+import asyncio
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from netwiz_backend.models import PaginationParams
+from netwiz_backend.netlist import repository
+from netwiz_backend.netlist.models import NetlistSubmission
+from netwiz_backend.netlist.repository import NetlistRepository
+
+USER_ID = str(uuid.uuid4())
+
+# Zero microseconds on purpose: pydantic's JSON form drops the fraction then
+BASE_TIME = datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+
+
+@pytest.fixture(autouse=True)
+def clear_repository_state():
+    repository._count_cache.clear()
+    repository._outbox.clear()
+    yield
+    repository._count_cache.clear()
+    repository._outbox.clear()
+
+
+def make_submission(timestamp: datetime = BASE_TIME) -> NetlistSubmission:
+    return NetlistSubmission(
+        id=uuid.uuid4(),
+        json_text="{}",
+        netlist=None,
+        user_id=USER_ID,
+        submission_timestamp=timestamp,
+    )
+
+
+@pytest.fixture
+def make_repo(stub_collection, stub_database):
+    """Build a repository holding one submission per timestamp"""
+
+    def make(*timestamps: datetime):
+        collection = stub_collection()
+        repo = NetlistRepository(stub_database(netlists=collection))
+
+        async def create_all():
+            for timestamp in timestamps:
+                await repo.create(make_submission(timestamp))
+
+        asyncio.run(create_all())
+        return repo, collection
+
+    return make
+
+
+def walk_pages(repo: NetlistRepository, page_size: int) -> list[list[str]]:
+    """List every page by following next_cursor, returning the page IDs"""
+    pagination = PaginationParams(page=1, page_size=page_size)
+
+    async def run():
+        pages, after = [], None
+        while True:
+            submissions, _, after = await repo.list(USER_ID, pagination, after)
+            pages.append([str(s.id) for s in submissions])
+            if after is None:
+                return pages
+
+    return asyncio.run(run())
+
+
+def recent_first_ids(collection) -> list[str]:
+    docs = sorted(collection.docs, key=lambda d: d["id"], reverse=True)
+    docs.sort(key=lambda d: d["submission_timestamp"], reverse=True)
+    return [d["id"] for d in docs]
+
+
+class TestStoredTimestamps:
+    def test_timestamps_are_stored_fixed_width(self, make_repo):
+        _, collection = make_repo(BASE_TIME, BASE_TIME + timedelta(microseconds=5))
+
+        assert [d["submission_timestamp"] for d in collection.docs] == [
+            "2024-01-01T12:00:00.000000Z",
+            "2024-01-01T12:00:00.000005Z",
+        ]
+
+    def test_stored_timestamps_sort_chronologically(self, make_repo):
+        _, collection = make_repo(
+            BASE_TIME + timedelta(milliseconds=500),
+            BASE_TIME,
+            BASE_TIME + timedelta(seconds=1),
+        )
+
+        stored = [d["submission_timestamp"] for d in collection.docs]
+        assert sorted(stored) == [stored[1], stored[0], stored[2]]
+
+
+class TestCursorPagination:
+    def test_cursor_walks_every_submission_once_in_order(self, make_repo):
+        repo, collection = make_repo(
+            *(BASE_TIME + timedelta(milliseconds=250 * i) for i in range(7))
+        )
+
+        pages = walk_pages(repo, page_size=3)
+        assert [len(page) for page in pages] == [3, 3, 1]
+        assert [i for page in pages for i in page] == recent_first_ids(collection)
+
+    def test_short_page_has_no_next_cursor(self, make_repo):
+        repo, _ = make_repo(BASE_TIME, BASE_TIME + timedelta(seconds=1))
+
+        submissions, total_count, next_cursor = asyncio.run(
+            repo.list(USER_ID, PaginationParams(page=1, page_size=5))
+        )
+        assert len(submissions) == 2
+        assert total_count == 2
+        assert next_cursor is None
+
+    def test_ties_on_the_same_timestamp_are_broken_by_id(self, make_repo):
+        repo, collection = make_repo(BASE_TIME, BASE_TIME, BASE_TIME, BASE_TIME)
+
+        pages = walk_pages(repo, page_size=1)
+        ids = [i for page in pages for i in page]
+        assert ids == recent_first_ids(collection)
+        assert len(set(ids)) == 4
+
+    def test_cursor_in_another_timezone_matches_utc(self, make_repo):
+        repo, _ = make_repo(BASE_TIME, BASE_TIME + timedelta(seconds=1))
+        pagination = PaginationParams(page=1, page_size=1)
+
+        async def run():
+            first, _, cursor = await repo.list(USER_ID, pagination)
+            cursor.submission_timestamp = cursor.submission_timestamp.astimezone(
+                timezone(timedelta(hours=2))
+            )
+            second, _, _ = await repo.list(USER_ID, pagination, cursor)
+            return first, second
+
+        first, second = asyncio.run(run())
+        assert first[0].submission_timestamp == BASE_TIME + timedelta(seconds=1)
+        assert second[0].submission_timestamp == BASE_TIME
+
+
+class TestDeferredInserts:
+    def test_queued_submissions_are_written_by_the_flush(self, make_repo):
+        repo, collection = make_repo()
+
+        async def run():
+            repo.create_deferred(make_submission())
+            repo.create_deferred(make_submission())
+            queued = len(collection.docs)
+            await repository.flush_deferred_inserts()
+            return queued
+
+        assert asyncio.run(run()) == 0
+        assert len(collection.docs) == 2
+        assert repository._outbox == []
+
+    def test_counts_are_dropped_once_the_write_lands(self, make_repo):
+        repo, _ = make_repo()
+
+        async def run():
+            repository._count_cache[None] = 0
+            repository._count_cache[USER_ID] = 0
+            repo.create_deferred(make_submission())
+            cached_while_queued = USER_ID in repository._count_cache
+            await repository.flush_deferred_inserts()
+            return cached_while_queued
+
+        assert asyncio.run(run()) is True
+        assert None not in repository._count_cache
+        assert USER_ID not in repository._count_cache
+
+    def test_a_failed_write_does_not_strand_other_collections(
+        self, make_repo, caplog
+    ):
+        failing, failing_collection = make_repo()
+        failing_collection.write_error = RuntimeError("write failed")
+        working, collection = make_repo()
+
+        async def run():
+            failing.create_deferred(make_submission())
+            working.create_deferred(make_submission())
+            await repository.flush_deferred_inserts()
+
+        asyncio.run(run())
+        assert failing_collection.docs == []
+        assert len(collection.docs) == 1
+        assert "deferred insert of 1 netlists failed" in caplog.text
+
+    def test_a_failed_background_write_is_logged_and_cleared(self, make_repo, caplog):
+        repo, collection = make_repo()
+        collection.write_error = RuntimeError("write failed")
+
+        async def run():
+            repo.create_deferred(make_submission())
+            await repository._flush_task
+
+        asyncio.run(run())
+        assert collection.docs == []
+        assert repository._outbox == []
+        assert repository._flush_task is None
+        assert "deferred insert of 1 netlists failed" in caplog.text
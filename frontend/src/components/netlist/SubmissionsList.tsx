@@ -9,7 +9,7 @@
 import React, { useState, useEffect, useCallback } from 'react'
 import { Clock, FileText, AlertCircle, AlertTriangle, User } from 'lucide-react'
 import { apiClient } from '@/services/api'
-import type { NetlistSubmission } from '@/types/netlist'
+import type { NetlistSubmission, NetlistSubmissionSummary } from '@/types/netlist'
 
 interface SubmissionsListProps {
   onSubmissionSelect: (submission: NetlistSubmission) => void
@@ -19,7 +19,7 @@ interface SubmissionsListProps {
 }
 
 interface SubmissionListItem {
-  submission: NetlistSubmission
+  submission: NetlistSubmissionSummary
   username?: string
 }
 
@@ -114,9 +114,8 @@ const SubmissionsList: React.FC<SubmissionsListProps> = ({
             ...submission,
             user_id: submission.user_id ?? null,
             filename: submission.filename ?? null,
-            validation_result: submission.validation_result ?? null,
-            netlist: submission.netlist ?? null
-          } as NetlistSubmission,
+            validation_result: submission.validation_result ?? null
+          },
           username: submission.user_id ? usernames[submission.user_id] || 'Loading...' : 'Unknown User'
         }
       }).filter(Boolean) as SubmissionListItem[]
@@ -165,16 +164,17 @@ const SubmissionsList: React.FC<SubmissionsListProps> = ({
     }
   }
 
-  const getErrorCount = (submission: NetlistSubmission) => {
+  const getErrorCount = (submission: NetlistSubmissionSummary) => {
     return submission.validation_result?.errors?.length || 0
   }
 
-  const getWarningCount = (submission: NetlistSubmission) => {
+  const getWarningCount = (submission: NetlistSubmissionSummary) => {
     return submission.validation_result?.warnings?.length || 0
   }
 
   const handleSubmissionClick = async (submissionId: string) => {
     try {
+      // List items carry no source text, so load the full submission
       const submission = await apiClient.getNetlist(submissionId)
 
       if (!submission) {
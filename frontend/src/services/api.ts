@@ -17,6 +17,8 @@ import axios, { AxiosInstance } from 'axios'
 // because the OpenAPI schema generation is incomplete (missing json_text field)
 import type {
   NetlistSubmission,
+  NetlistSubmissionSummary,
+  NetlistListResponse,
 } from '@/types/netlist'
 import type {
   User,
@@ -203,8 +205,11 @@ class NetWizApiClient {
     page_size?: number
     user_id?: string
     list_all?: boolean
-  }): Promise<{ submissions: NetlistSubmission[]; total_count: number; page: number; page_size: number }> {
-    const response = await this.client.get<{ submissions: NetlistSubmission[]; total_count: number; page: number; page_size: number }>(
+    // next_cursor of the previous page; both or neither
+    after_timestamp?: string
+    after_id?: string
+  }): Promise<NetlistListResponse> {
+    const response = await this.client.get<NetlistListResponse>(
       '/netlist',
       {
         params,
@@ -216,7 +221,47 @@ class NetWizApiClient {
     return response.data
   }
 
-  async uploadFile(file: File, filename?: string): Promise<NetlistSubmission> {
+  // Yields every matching submission summary, newest first, and returns the
+  // total count from the stream's last line
+  async *streamNetlists(params?: {
+    user_id?: string
+    list_all?: boolean
+  }): AsyncGenerator<NetlistSubmissionSummary, number> {
+    const query = new URLSearchParams()
+    if (params?.user_id) query.set('user_id', params.user_id)
+    if (params?.list_all) query.set('list_all', 'true')
+
+    // fetch rather than axios, which cannot hand over a response body as it arrives
+    const response = await fetch(`${this.client.defaults.baseURL}/netlist/stream?${query}`, {
+      headers: {
+        ...this.getAuthHeaders(),
+      },
+    })
+    if (!response.ok || !response.body) {
+      throw new Error(`Failed to stream netlists (status ${response.status})`)
+    }
+
+    const reader = response.body.getReader()
+    const decoder = new TextDecoder()
+    let buffer = ''
+    for (;;) {
+      const { done, value } = await reader.read()
+      if (done) break
+      buffer += decoder.decode(value, { stream: true })
+      const lines = buffer.split('\n')
+      buffer = lines.pop() ?? ''
+      for (const line of lines) {
+        if (!line) continue
+        const item = JSON.parse(line)
+        if ('total_count' in item) return item.total_count
+        yield item as NetlistSubmissionSummary
+      }
+    }
+    throw new Error('Netlist stream ended before its total count')
+  }
+
+  // With durable=false the server answers 202 before the submission is stored
+  async uploadFile(file: File, filename?: string, durable: boolean = true): Promise<NetlistSubmission> {
     const formData = new FormData()
     formData.append('file', file)
     if (filename) {
@@ -227,6 +272,7 @@ class NetWizApiClient {
       '/netlist/upload',
       formData,
       {
+        params: durable ? undefined : { durable: false },
         headers: {
           ...this.getAuthHeaders(),
           'Content-Type': 'multipart/form-data',
@@ -255,6 +301,9 @@ export type {
   Pin,
   NetConnection,
   NetlistSubmission,
+  NetlistSubmissionSummary,
+  NetlistListCursor,
+  NetlistListResponse,
   ValidationRequest,
   ValidationResponse
 } from '@/types/netlist'
@@ -7,7 +7,6 @@
 
 // LocationInfo type that matches the backend LocationInfo model
 export interface LocationInfo {
-  parents: LocationInfo[]
   key: string
   kind: 'key' | 'object' | 'list' | 'null' | 'string' | 'boolean' | 'number'
   start_character_number: number
@@ -16,6 +15,8 @@ export interface LocationInfo {
   end_character_number: number
   end_line_number: number
   end_line_character_number: number
+  parent: LocationInfo | null
+  level: number
 }
 
 // ValidationErrorType type that matches the backend ValidationErrorType model
@@ -103,6 +104,23 @@ export interface NetlistSubmission {
   filename: string | null
 }
 
+// Listing entry: a submission without its source text or netlist data
+export type NetlistSubmissionSummary = Omit<NetlistSubmission, 'json_text' | 'netlist'>
+
+// Position after the last listed submission; pass back as after_timestamp/after_id
+export interface NetlistListCursor {
+  submission_timestamp: string
+  id: string
+}
+
+export interface NetlistListResponse {
+  submissions: NetlistSubmissionSummary[]
+  total_count: number
+  page: number
+  page_size: number
+  next_cursor: NetlistListCursor | null
+}
+
 export interface ValidationRequest {
   netlist: Netlist
 }